@@ -17,7 +17,7 @@ from .models import Category, SubCategory
 
 @admin.register(Category)
 class CategoryAdmin(TranslatableAdmin):
-    list_display = ('name', 'id', 'image_thumbnail', 'subcategories_count', 'slug')
+    list_display = ('name', 'id', 'image_thumbnail', 'subcategories_count', 'product_count', 'slug')
     search_fields = ('translations__name',)
     readonly_fields = ('image_thumbnail', 'second_image_preview', 'image_compressed', 'second_image_compressed')
     # inlines = [SubCategoryInline]
@@ -35,14 +35,10 @@ class CategoryAdmin(TranslatableAdmin):
         return ''
     second_image_preview.short_description = 'Second Image Preview'
 
-    def subcategories_count(self, obj):
-        return obj.subcategories.count()
-    subcategories_count.short_description = 'Subcategories'
-
 
 @admin.register(SubCategory)
 class SubCategoryAdmin(TranslatableAdmin):
-    list_display = ('name', 'category', 'id', 'image_thumbnail', 'slug')
+    list_display = ('name', 'category', 'id', 'image_thumbnail', 'product_count', 'slug')
     search_fields = ('translations__name', 'category__translations__name')
     list_filter = ('category',)
     readonly_fields = ('image_thumbnail', 'image_compressed')
@@ -0,0 +1 @@
+from apps.categories.management.recount_catalog import Command
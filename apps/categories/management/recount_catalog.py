@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.categories.models import Category, SubCategory
+from apps.categories.tree import invalidate_category_tree
+from apps.products.documents import invalidate_subcategory_documents
+from apps.products.models import Product
+from apps.shared.response_cache import object_tag, purge_tags, type_tag
+
+
+@dataclass
+class Stats:
+    subcategories_fixed: int = 0
+    categories_fixed: int = 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the product_count / subcategories_count counter columns of "
+        "Category and SubCategory from the actual rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the counters that are off without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        stats = Stats()
+
+        # One grouped query gives the product count of every subcategory and of its category.
+        subcategory_products = Counter()
+        category_products = Counter()
+        for row in Product.objects.values("subcategory_id", "subcategory__category_id").annotate(total=Count("pk")):
+            if row["subcategory_id"] is not None:
+                subcategory_products[row["subcategory_id"]] += row["total"]
+            if row["subcategory__category_id"] is not None:
+                category_products[row["subcategory__category_id"]] += row["total"]
+        category_subcategories = Counter({
+            row["category_id"]: row["total"]
+            for row in SubCategory.objects.exclude(category_id=None).values("category_id").annotate(total=Count("pk"))
+        })
+
+        now = timezone.now()
+        subcategories = []
+        for subcategory in SubCategory.objects.only("pk", "product_count"):
+            actual = subcategory_products[subcategory.pk]
+            if subcategory.product_count != actual:
+                self._report(options["dry_run"], f"SubCategory#{subcategory.pk}", subcategory.product_count, actual)
+                subcategory.product_count = actual
+                subcategory.updated_at = now
+                subcategories.append(subcategory)
+
+        categories = []
+        for category in Category.objects.only("pk", "product_count", "subcategories_count"):
+            actual = (category_products[category.pk], category_subcategories[category.pk])
+            if (category.product_count, category.subcategories_count) != actual:
+                self._report(
+                    options["dry_run"], f"Category#{category.pk}",
+                    (category.product_count, category.subcategories_count), actual,
+                )
+                category.product_count, category.subcategories_count = actual
+                category.updated_at = now
+                categories.append(category)
+
+        stats.subcategories_fixed = len(subcategories)
+        stats.categories_fixed = len(categories)
+        if not options["dry_run"] and (subcategories or categories):
+            # bulk_update sends no signals: invalidate the tree, the cached responses and the
+            # product documents (they embed their subcategory's product_count) here.
+            subcategory_ids = {subcategory.pk for subcategory in subcategories}
+            tags = {type_tag(SubCategory), type_tag(Category)}
+            tags.update(object_tag(SubCategory, subcategory.pk) for subcategory in subcategories)
+            tags.update(object_tag(Category, category.pk) for category in categories)
+            with transaction.atomic():
+                SubCategory.objects.bulk_update(subcategories, ["product_count", "updated_at"], batch_size=500)
+                Category.objects.bulk_update(
+                    categories, ["product_count", "subcategories_count", "updated_at"], batch_size=500,
+                )
+                transaction.on_commit(invalidate_category_tree)
+                transaction.on_commit(lambda: purge_tags(tags))
+                transaction.on_commit(lambda: invalidate_subcategory_documents(subcategory_ids))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done. subcategories_fixed={subcategories}, categories_fixed={categories}, dry_run={dry_run}".format(
+                    subcategories=stats.subcategories_fixed,
+                    categories=stats.categories_fixed,
+                    dry_run=options["dry_run"],
+                )
+            )
+        )
+
+    def _report(self, dry_run, label, stored, actual):
+        prefix = "[DRY-RUN] Would fix" if dry_run else "Fixing"
+        self.stdout.write(self.style.NOTICE(f"{prefix} {label}: {stored} -> {actual}"))
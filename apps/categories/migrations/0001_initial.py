@@ -0,0 +1,98 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+import apps.categories.models
+import apps.company.utils
+import apps.shared.mixins
+import django.db.models.deletion
+import parler.fields
+import parler.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='categories/')),
+                ('image_compressed', models.ImageField(blank=True, null=True, upload_to='categories/compressed/')),
+                ('second_image', models.ImageField(blank=True, null=True, upload_to='categories/')),
+                ('second_image_compressed', models.ImageField(blank=True, null=True, upload_to='categories/compressed/')),
+                ('slug', models.SlugField(allow_unicode=True, blank=True, default=None, help_text='URL-friendly identifier. Auto-generated from name.', max_length=255, null=True, unique=True)),
+                ('product_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('subcategories_count', models.PositiveIntegerField(default=0, editable=False)),
+            ],
+            options={
+                'verbose_name': 'Category',
+                'verbose_name_plural': 'Categories',
+                'ordering': ['id'],
+            },
+            bases=(apps.shared.mixins.TranslatableAutoFillMixin, apps.categories.models.CounterCacheMixin, parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='SubCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='subcategories/')),
+                ('image_compressed', models.ImageField(blank=True, null=True, upload_to='subcategories/compressed/')),
+                ('slug', models.SlugField(allow_unicode=True, blank=True, default=None, help_text='URL-friendly identifier. Auto-generated from name.', max_length=255, null=True, unique=True)),
+                ('product_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='subcategories', to='categories.category')),
+            ],
+            options={
+                'verbose_name': 'SubCategory',
+                'verbose_name_plural': 'SubCategories',
+                'ordering': ['id'],
+            },
+            bases=(apps.shared.mixins.TranslatableAutoFillMixin, apps.categories.models.CounterCacheMixin, parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='CategoryTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(max_length=255)),
+                ('unique_code', models.CharField(blank=True, default=apps.company.utils.get_unique_code, max_length=50, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='categories.category')),
+            ],
+            options={
+                'verbose_name': 'Category Translation',
+                'db_table': 'categories_category_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='SubCategoryTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(max_length=255)),
+                ('unique_code', models.CharField(blank=True, default=apps.company.utils.get_unique_code, max_length=50, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='categories.subcategory')),
+            ],
+            options={
+                'verbose_name': 'SubCategory Translation',
+                'db_table': 'categories_subcategory_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+    ]
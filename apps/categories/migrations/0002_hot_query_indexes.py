@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built with CREATE INDEX CONCURRENTLY, which cannot run in a transaction,
+    # so writes to these tables are not blocked while they build.
+    atomic = False
+
+    dependencies = [
+        ('categories', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='categorytranslation',
+            index=models.Index(fields=['master', 'language_code'], name='category_tr_master_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='subcategorytranslation',
+            index=models.Index(fields=['master', 'language_code'], name='subcategory_tr_master_idx'),
+        ),
+    ]
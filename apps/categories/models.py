@@ -1,16 +1,13 @@
 import uuid
-import asyncio
-import inspect
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
-from googletrans import Translator
 from django.utils.text import slugify
 from apps.company.utils import get_unique_code
 from apps.company.middleware import get_logger
+from apps.shared.mixins import TranslatableAutoFillMixin
 
 logger = get_logger()   
-translator = Translator()
 
 
 class BaseModel(models.Model):
@@ -21,8 +18,36 @@ class BaseModel(models.Model):
         abstract = True
 
 
-class Category(BaseModel, TranslatableModel):
+def translation_meta(name):
+    """``TranslatedFields`` meta with a (master, language_code) index for the translation prefetches.
+
+    parler's own unique index leads with language_code, which does not serve
+    ``master_id IN (...)`` lookups narrowed to a few languages.
+    """
+    return {'indexes': [models.Index(fields=['master', 'language_code'], name=f'{name}_tr_master_idx')]}
+
+
+class CounterCacheMixin:
+    """Keep counter columns maintained by signals out of full saves.
+
+    The counters are changed with ``F()`` updates while instances may be held
+    in memory, so saving an existing instance writes every field except
+    ``counter_fields``; a stale in-memory count never overwrites the stored one.
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None and not args:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+
+
+class Category(TranslatableAutoFillMixin, CounterCacheMixin, BaseModel, TranslatableModel):
     translations = TranslatedFields(
+        meta=translation_meta('category'),
         name=models.CharField(max_length=255),
         unique_code=models.CharField(max_length=50, default=get_unique_code, blank=True, null=True),
     )
@@ -40,6 +65,15 @@ class Category(BaseModel, TranslatableModel):
         allow_unicode=True,
     )
 
+    # Maintained by apps.categories.signals; recount with `manage.py recount_catalog`.
+    product_count = models.PositiveIntegerField(default=0, editable=False)
+    subcategories_count = models.PositiveIntegerField(default=0, editable=False)
+
+    auto_translate_fields = ('name',)
+    auto_translate_copy_fields = ('unique_code',)
+    auto_translate_any_source = True
+    counter_fields = ('product_count', 'subcategories_count')
+
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
@@ -57,57 +91,17 @@ class Category(BaseModel, TranslatableModel):
                 self.slug = slugify(f"{name}-{Unique_code}", allow_unicode=True)
 
         super().save(*args, **kwargs)
-        supported_langs = {'uz', 'ru', 'en'}
-        
-        # 1. Identify source translation
-        source_context = None
-        try:
-             source_context = self.translations.get(language_code='uz')
-        except self.translations.model.DoesNotExist:
-             source_context = self.translations.first()
-        
-        if not source_context:
-            # logger.warning(f"⚠️ No translations found for {self} after save.")
-            return
-
-        source_lang = source_context.language_code
-        
+
+    def prepare_source_translation(self, source):
         # Ensure source fields are populated
-        uc = source_context.unique_code or get_unique_code()
-        need_save = False
-        if not source_context.unique_code:
-             source_context.unique_code = uc
-             need_save = True
-        
-        if need_save:
-             source_context.save()
-
-        # 2. Auto-translate
-        target_langs = supported_langs - {source_lang}
-
-        for lang in target_langs:
-            try:
-                if self.translations.filter(language_code=lang).exists():
-                    continue
-
-                res = translator.translate(source_context.name, src=source_lang, dest=lang)
-                if inspect.isawaitable(res):
-                    translated_name = asyncio.run(res).text
-                else:
-                    translated_name = res.text
-                
-                self.create_translation(
-                    language_code=lang,
-                    name=translated_name,
-                    unique_code=uc 
-                )
-                logger.info(f"✅ Translated {lang}: {translated_name}")
-            except Exception as e:
-                logger.error(f"❌ Translation failed for {lang} (src: {source_lang}): {e}")
+        if not source.unique_code:
+            source.unique_code = get_unique_code()
+            source.save()
 
 
-class SubCategory(TranslatableModel, BaseModel):
+class SubCategory(TranslatableAutoFillMixin, CounterCacheMixin, TranslatableModel, BaseModel):
     translations = TranslatedFields(
+        meta=translation_meta('subcategory'),
         name=models.CharField(max_length=255),
         unique_code=models.CharField(max_length=50, default=get_unique_code, blank=True, null=True),
     )
@@ -124,6 +118,14 @@ class SubCategory(TranslatableModel, BaseModel):
         allow_unicode=True
     )
 
+    # Maintained by apps.categories.signals; recount with `manage.py recount_catalog`.
+    product_count = models.PositiveIntegerField(default=0, editable=False)
+
+    auto_translate_fields = ('name',)
+    auto_translate_copy_fields = ('unique_code',)
+    auto_translate_any_source = True
+    counter_fields = ('product_count',)
+
     class Meta:
         verbose_name = _("SubCategory")
         verbose_name_plural = _("SubCategories")
@@ -141,47 +143,8 @@ class SubCategory(TranslatableModel, BaseModel):
                 self.slug = slugify(f"{name}-{Unique_code}", allow_unicode=True)
                 
         super().save(*args, **kwargs)
-        supported_langs = {'uz', 'ru', 'en'}
-        
-        source_context = None
-        try:
-             source_context = self.translations.get(language_code='uz')
-        except self.translations.model.DoesNotExist:
-             source_context = self.translations.first()
-        
-        if not source_context:
-            # logger.warning(f"⚠️ No translations found for {self} after save.")
-            return
-
-        source_lang = source_context.language_code
-        uc = source_context.unique_code or get_unique_code()
-        
-        need_save = False
-        if not source_context.unique_code:
-             source_context.unique_code = uc
-             need_save = True
-        
-        if need_save:
-             source_context.save()
-
-        target_langs = supported_langs - {source_lang}
-
-        for lang in target_langs:
-            try:
-                if self.translations.filter(language_code=lang).exists():
-                    continue
-
-                res = translator.translate(source_context.name, src=source_lang, dest=lang)
-                if inspect.isawaitable(res):
-                    translated_name = asyncio.run(res).text
-                else:
-                    translated_name = res.text
-                
-                self.create_translation(
-                    language_code=lang,
-                    name=translated_name,
-                    unique_code=uc 
-                )
-                logger.info(f"✅ Translated {lang}: {translated_name}")
-            except Exception as e:
-                logger.error(f"❌ Translation failed for {lang} (src: {source_lang}): {e}")
+
+    def prepare_source_translation(self, source):
+        if not source.unique_code:
+            source.unique_code = get_unique_code()
+            source.save()
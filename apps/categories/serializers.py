@@ -1,11 +1,13 @@
 from rest_framework import serializers
 from parler_rest.serializers import TranslatableModelSerializer, TranslatedFieldsField
+from apps.shared.fieldsets import SparseFieldsetMixin, nested_context
+from apps.shared.fragments import FragmentCacheMixin, FragmentListSerializer
+from apps.shared.projection import LanguageProjectionMixin
 from .models import Category, SubCategory
-from apps.products.models import Product
 
 
 
-class CategorySimpleSerializer(TranslatableModelSerializer):
+class CategorySimpleSerializer(LanguageProjectionMixin, TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=Category)
 
     class Meta:
@@ -21,25 +23,24 @@ class CategorySimpleSerializer(TranslatableModelSerializer):
         ]
 
 
-class SubCategorySerializer(TranslatableModelSerializer):
+class SubCategorySerializer(SparseFieldsetMixin, FragmentCacheMixin, LanguageProjectionMixin,
+                            TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=SubCategory)
-    product_count = serializers.SerializerMethodField()
+    product_count = serializers.IntegerField(read_only=True)
     # category = CategorySimpleSerializer(read_only=True)
 
     class Meta:
         model = SubCategory
         fields = ['id', 'translations', 'slug', 'image', 'image_compressed', 'product_count']
+        list_serializer_class = FragmentListSerializer
         # fields = ['id', 'translations', 'image', 'product_count', 'category']
 
-    def get_product_count(self, obj):
-        return Product.objects.filter(subcategory=obj).count()
 
-
-class CategorySerializer(TranslatableModelSerializer):
+class CategorySerializer(SparseFieldsetMixin, LanguageProjectionMixin, TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=Category)
     subcategories = serializers.SerializerMethodField()
-    subcategories_count = serializers.SerializerMethodField()
-    product_count = serializers.SerializerMethodField()
+    subcategories_count = serializers.IntegerField(read_only=True)
+    product_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Category
@@ -55,26 +56,22 @@ class CategorySerializer(TranslatableModelSerializer):
             'subcategories_count',
             'product_count',
         ]
+        expandable_fields = ['subcategories']
 
     def get_subcategories(self, obj):
         qs = obj.subcategories.all()
-        return SubCategorySerializer(qs, many=True, context=self.context).data
-
-    def get_subcategories_count(self, obj):
-        return obj.subcategories.all().count()
+        return SubCategorySerializer(qs, many=True, context=nested_context(self.context)).data
 
-    def get_product_count(self, obj):
-        return Product.objects.filter(subcategory__category=obj).count()
 
 
-class CategoriesWithSubcategoriesSerializer(TranslatableModelSerializer):
+class CategoriesWithSubcategoriesSerializer(LanguageProjectionMixin, TranslatableModelSerializer):
     """Detailed category serializer with subcategories"""
     subcategories = serializers.SerializerMethodField()
     translations = TranslatedFieldsField(shared_model=Category)
 
     def get_subcategories(self, obj):
         qs = obj.subcategories.all()
-        return SubCategorySerializer(qs, many=True, context=self.context).data
+        return SubCategorySerializer(qs, many=True, context=nested_context(self.context)).data
 
     class Meta:
         model = Category
@@ -1,13 +1,20 @@
 import os
 
 from django.db import transaction
-from django.db.models.signals import post_save, pre_save
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from apps.company.middleware import get_logger
+from apps.products.models import Product
 from apps.products.utils import compress_image
+from apps.shared.fragments import touch, touch_parent_on_change
+from apps.shared.signals import translations_bulk_created
 
 from .models import Category, SubCategory
+from .tree import invalidate_category_tree
 
 logger = get_logger()
 
@@ -28,8 +35,9 @@ def _compress_category_image(instance, image_attr: str, compressed_attr: str):
 
         getattr(instance, compressed_attr).save(compressed.name, compressed, save=False)
         type(instance).objects.filter(pk=instance.pk).update(
-            **{compressed_attr: getattr(instance, compressed_attr)}
+            **{compressed_attr: getattr(instance, compressed_attr)}, updated_at=timezone.now(),
         )
+        invalidate_category_tree()
 
         old_path_attr = f"_old_{compressed_attr}_path"
         old_compressed_path = getattr(instance, old_path_attr, None)
@@ -89,6 +97,7 @@ def track_subcategory_image_changes(sender, instance, **kwargs):
 
     try:
         old_instance = sender.objects.get(pk=instance.pk)
+        instance._old_category_id = old_instance.category_id
         instance._image_changed = old_instance.image != instance.image
         if instance._image_changed:
             instance._old_compressed_path = (
@@ -108,3 +117,94 @@ def compress_subcategory_image_after_save(sender, instance, created, **kwargs):
         return
 
     transaction.on_commit(lambda: _compress_category_image(instance, 'image', 'image_compressed'))
+
+
+def _adjust_counters(queryset, **deltas):
+    """Add ``deltas`` to counter columns with a single UPDATE, never going below zero."""
+    changes = {field: Greatest(F(field) + delta, 0) for field, delta in deltas.items() if delta}
+    if changes:
+        queryset.update(**changes, updated_at=timezone.now())
+        transaction.on_commit(invalidate_category_tree)
+
+
+def _adjust_product_count(subcategory_id, delta):
+    """Add ``delta`` to the product count of a subcategory and of its category."""
+    if subcategory_id is None:
+        return
+    _adjust_counters(SubCategory.objects.filter(pk=subcategory_id), product_count=delta)
+    _adjust_counters(Category.objects.filter(subcategories=subcategory_id), product_count=delta)
+
+
+@receiver(pre_save, sender=Product)
+def track_product_subcategory_change(sender, instance, **kwargs):
+    instance._old_subcategory_id = (
+        sender.objects.filter(pk=instance.pk).values_list('subcategory_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Product)
+def count_product_after_save(sender, instance, created, **kwargs):
+    old_subcategory_id = None if created else getattr(instance, '_old_subcategory_id', None)
+    if old_subcategory_id != instance.subcategory_id:
+        _adjust_product_count(old_subcategory_id, -1)
+        _adjust_product_count(instance.subcategory_id, 1)
+
+
+@receiver(post_delete, sender=Product)
+def count_product_after_delete(sender, instance, **kwargs):
+    _adjust_product_count(instance.subcategory_id, -1)
+
+
+@receiver(post_save, sender=SubCategory)
+def count_subcategory_after_save(sender, instance, created, **kwargs):
+    old_category_id = None if created else getattr(instance, '_old_category_id', None)
+    if old_category_id == instance.category_id:
+        return
+    product_count = SubCategory.objects.filter(pk=instance.pk).values_list('product_count', flat=True).first() or 0
+    if old_category_id is not None:
+        _adjust_counters(
+            Category.objects.filter(pk=old_category_id), subcategories_count=-1, product_count=-product_count,
+        )
+    if instance.category_id is not None:
+        _adjust_counters(
+            Category.objects.filter(pk=instance.category_id), subcategories_count=1, product_count=product_count,
+        )
+
+
+def _recount_category(category_id):
+    Category.objects.filter(pk=category_id).update(
+        product_count=Product.objects.filter(subcategory__category_id=category_id).count(),
+        subcategories_count=SubCategory.objects.filter(category_id=category_id).count(),
+        updated_at=timezone.now(),
+    )
+    invalidate_category_tree()
+
+
+@receiver(post_delete, sender=SubCategory)
+def count_subcategory_after_delete(sender, instance, **kwargs):
+    # The cascade may delete the subcategory before its products (deferred FKs), so the
+    # products' decrements can miss the category; recount it once everything is gone.
+    category_id = instance.category_id
+    if category_id is not None:
+        transaction.on_commit(lambda: _recount_category(category_id))
+
+
+def _invalidate_category_tree(sender, **kwargs):
+    transaction.on_commit(invalidate_category_tree)
+
+
+for _model in (Category, SubCategory):
+    for _sender in (_model, _model._parler_meta.root_model):
+        post_save.connect(_invalidate_category_tree, sender=_sender, dispatch_uid=f'tree_{_sender._meta.label_lower}_save')
+        post_delete.connect(_invalidate_category_tree, sender=_sender, dispatch_uid=f'tree_{_sender._meta.label_lower}_delete')
+    translations_bulk_created.connect(_invalidate_category_tree, sender=_model, dispatch_uid=f'tree_{_model._meta.label_lower}_bulk')
+
+
+# Translations are rendered inside the subcategory's cached fragment.
+touch_parent_on_change(SubCategory._parler_meta.root_model, 'master')
+
+
+@receiver(translations_bulk_created, sender=SubCategory)
+def touch_subcategories_after_bulk_translations(sender, master_ids, **kwargs):
+    touch(SubCategory, master_ids)
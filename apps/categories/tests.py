@@ -1,3 +1,36 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from .models import Category
+from .tree import invalidate_category_tree
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CategoryTreeValidatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category()
+        category.set_current_language('uz')
+        category.name = 'Nasoslar'
+        category.save()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unchanged_tree_is_not_modified(self):
+        url = reverse('categories:category-tree')
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        etag = response['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        invalidate_category_tree()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()[0]['name'], 'Nasoslar')
@@ -0,0 +1,91 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import Value
+
+from apps.shared.cache import bump_cache_version, get_or_compute_entry
+
+from .models import Category, SubCategory
+
+CATEGORY_TREE_NAMESPACE = 'category_tree'
+CATEGORY_TREE_TIMEOUT = 60 * 60 * 24
+FALLBACK_LANGUAGE = 'uz'
+
+
+def invalidate_category_tree():
+    bump_cache_version(CATEGORY_TREE_NAMESPACE)
+
+
+def _names(language_code):
+    """``{(kind, id): name}`` for categories and subcategories, read with one UNION query."""
+    languages = {language_code, FALLBACK_LANGUAGE}
+    category_names = Category._parler_meta.root_model.objects.filter(language_code__in=languages).values_list(
+        Value('category'), 'master_id', 'language_code', 'name',
+    )
+    subcategory_names = SubCategory._parler_meta.root_model.objects.filter(language_code__in=languages).values_list(
+        Value('subcategory'), 'master_id', 'language_code', 'name',
+    )
+    names = {}
+    for kind, master_id, row_language, name in category_names.union(subcategory_names, all=True):
+        # The requested language wins over the fallback whatever order the rows come in.
+        if row_language == language_code or (kind, master_id) not in names:
+            names[kind, master_id] = name
+    return names
+
+
+def build_category_tree(language_code, base_url=''):
+    """Categories with their subcategories and product counts, built from three queries.
+
+    Counts come from the counter columns maintained by the category signals,
+    names from the translations of ``language_code`` with uz as fallback.
+    """
+    def media_url(name):
+        return f'{base_url}{default_storage.url(name)}' if name else None
+
+    names = _names(language_code)
+    subcategories = {}
+    for row in SubCategory.objects.order_by('id').values(
+        'id', 'category_id', 'slug', 'image', 'image_compressed', 'product_count',
+    ):
+        subcategories.setdefault(row['category_id'], []).append({
+            'id': row['id'],
+            'name': names.get(('subcategory', row['id'])),
+            'slug': row['slug'],
+            'image': media_url(row['image']),
+            'image_compressed': media_url(row['image_compressed']),
+            'product_count': row['product_count'],
+        })
+
+    return [
+        {
+            'id': row['id'],
+            'name': names.get(('category', row['id'])),
+            'slug': row['slug'],
+            'image': media_url(row['image']),
+            'image_compressed': media_url(row['image_compressed']),
+            'second_image': media_url(row['second_image']),
+            'second_image_compressed': media_url(row['second_image_compressed']),
+            'product_count': row['product_count'],
+            'subcategories_count': row['subcategories_count'],
+            'subcategories': subcategories.get(row['id'], []),
+        }
+        for row in Category.objects.order_by('id').values(
+            'id', 'slug', 'image', 'image_compressed', 'second_image', 'second_image_compressed',
+            'product_count', 'subcategories_count',
+        )
+    ]
+
+
+def get_category_tree_entry(language_code, base_url=''):
+    """Cache entry of :func:`build_category_tree`, the tree being its ``value``.
+
+    Invalidated by :func:`invalidate_category_tree`; after an invalidation one
+    worker rebuilds the tree while the others keep serving the previous one.
+    """
+    if language_code not in dict(settings.LANGUAGES):
+        language_code = FALLBACK_LANGUAGE
+    return get_or_compute_entry(
+        f'{CATEGORY_TREE_NAMESPACE}:{language_code}:{base_url}',
+        CATEGORY_TREE_NAMESPACE,
+        lambda: build_category_tree(language_code, base_url),
+        CATEGORY_TREE_TIMEOUT,
+    )
@@ -1,10 +1,11 @@
 from django.urls import path
-from .views import CategoryListView, CategoryDetailView, SubCategoryListView
+from .views import CategoryListView, CategoryDetailView, SubCategoryListView, CategoryTreeView
 
 app_name = 'categories'
 
 urlpatterns = [
     path('', CategoryListView.as_view(), name='category-list'),
+    path('tree/', CategoryTreeView.as_view(), name='category-tree'),
     path('subcategories/', SubCategoryListView.as_view(), name='subcategory-list'),
     path('<path:slug>/', CategoryDetailView.as_view(), name='category-detail'),
 ]
@@ -1,51 +1,86 @@
 from rest_framework import generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from apps.products.documents import get_base_url
+from apps.products.models import Product
+from apps.shared.fieldsets import nested_context
+from apps.shared.projection import projection_language, translations_prefetch
+from apps.shared.response_cache import cache_response, conditional_response
+from apps.shared.slugs import resolve_slug
 from .models import Category, SubCategory
 from .serializers import CategorySerializer, SubCategorySerializer
+from .tree import get_category_tree_entry
 
 
+@cache_response(Category, SubCategory, Product)
 class CategoryListView(generics.ListAPIView):
     """List all categories"""
     serializer_class = CategorySerializer
     queryset = Category.objects.all()
 
     def get(self, request):
-        categories = Category.objects.all()
+        projected = projection_language(request)
+        categories = Category.objects.prefetch_related(translations_prefetch('translations', Category, projected))
+        if 'subcategories' in CategorySerializer.selected_field_names(request):
+            categories = categories.prefetch_related(
+                translations_prefetch('subcategories__translations', SubCategory, projected),
+            )
         serializer = self.get_serializer(categories, many=True)
         return Response(serializer.data)
 
 
+@cache_response(Category, SubCategory, Product)
 class CategoryDetailView(APIView):
     """Get category details by slug"""
     def get(self, request, slug):
         lang = request.GET.get('lang', 'uz')
+        projected = projection_language(request)
+        category_id = resolve_slug(Category, slug)
+        if category_id is None:
+            return Response({'detail': 'Not found.'}, status=404)
+
         category = Category.objects.language(lang).filter(
-            slug=slug,
+            pk=category_id,
             translations__language_code=lang
+        ).prefetch_related(
+            translations_prefetch('translations', Category, projected),
         ).first()
 
         if not category:
             return Response({'detail': 'Not found.'}, status=404)
 
-        subcategories = SubCategory.objects.filter(category=category)
         serializer = CategorySerializer(category, context={'request': request})
         data = serializer.data
-        data['subcategories'] = SubCategorySerializer(
-            subcategories,
-            many=True,
-            context={'request': request}
-        ).data
+        if 'subcategories' in data:
+            subcategories = SubCategory.objects.filter(category=category).prefetch_related(
+                translations_prefetch('translations', SubCategory, projected),
+            )
+            data['subcategories'] = SubCategorySerializer(
+                subcategories,
+                many=True,
+                context=nested_context({'request': request})
+            ).data
 
         return Response(data, status=200)
 
 
+@cache_response(SubCategory, Product)
 class SubCategoryListView(generics.ListAPIView):
     """List all subcategories"""
     serializer_class = SubCategorySerializer
     queryset = SubCategory.objects.all()
 
     def get(self, request):
-        subcategories = SubCategory.objects.all()
+        subcategories = SubCategory.objects.prefetch_related(
+            translations_prefetch('translations', SubCategory, projection_language(request)),
+        )
         serializer = self.get_serializer(subcategories, many=True)
         return Response(serializer.data)
+
+
+class CategoryTreeView(APIView):
+    """All categories with their subcategories and product counts, cached per language"""
+    def get(self, request):
+        lang = request.GET.get('lang', 'uz')
+        entry = get_category_tree_entry(lang, get_base_url(request))
+        return conditional_response(request, Response(entry['value']), {'category_tree': entry})
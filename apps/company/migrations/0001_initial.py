@@ -0,0 +1,174 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+import apps.shared.mixins
+import django.db.models.deletion
+import parler.fields
+import parler.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Banner',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'verbose_name': 'Banner',
+                'verbose_name_plural': 'Banners',
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='Company',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('telegram', models.URLField(blank=True, max_length=2000, null=True)),
+                ('instagram', models.URLField(blank=True, max_length=2000, null=True)),
+                ('facebook', models.URLField(blank=True, max_length=2000, null=True)),
+                ('youtube', models.URLField(blank=True, max_length=2000, null=True)),
+                ('phone', models.CharField(blank=True, max_length=50, null=True)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('website', models.URLField(blank=True, max_length=2000, null=True)),
+            ],
+            options={
+                'verbose_name': 'Company',
+                'verbose_name_plural': 'Companies',
+            },
+            bases=(apps.shared.mixins.TranslatableAutoFillMixin, parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='Connection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('name', models.CharField(max_length=255)),
+                ('phone_number', models.CharField(max_length=50)),
+                ('message', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Connection Request',
+                'verbose_name_plural': 'Connection Requests',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='New',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('slug', models.SlugField(blank=True, max_length=255, null=True, unique=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='news/')),
+                ('alt', models.CharField(blank=True, max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('published_at', models.DateTimeField(blank=True, null=True)),
+                ('new_type', models.CharField(choices=[('news_product', 'Yangi mahsulot'), ('event', 'Tadbir')], default='event', max_length=255)),
+            ],
+            options={
+                'verbose_name': 'News',
+                'verbose_name_plural': 'News',
+                'ordering': ['-published_at'],
+            },
+            bases=(apps.shared.mixins.TranslatableAutoFillMixin, parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='Partners',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('image', models.ImageField(upload_to='partners')),
+            ],
+            options={
+                'verbose_name': 'Partner',
+                'verbose_name_plural': 'Partners',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BannerImages',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='banners/additional/')),
+                ('alt', models.CharField(blank=True, max_length=255)),
+                ('banner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='additional_images', to='company.banner')),
+            ],
+            options={
+                'verbose_name': 'Banner Image',
+                'verbose_name_plural': 'Banner Images',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BannerTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('alt', models.CharField(blank=True, max_length=255, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='company.banner')),
+            ],
+            options={
+                'verbose_name': 'Banner Translation',
+                'db_table': 'company_banner_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='CompanyTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('address', models.CharField(blank=True, max_length=255, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='company.company')),
+            ],
+            options={
+                'verbose_name': 'Company Translation',
+                'db_table': 'company_company_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='NewTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('title', models.CharField(blank=True, max_length=255, null=True)),
+                ('summary', models.TextField(blank=True, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='company.new')),
+            ],
+            options={
+                'verbose_name': 'News Translation',
+                'db_table': 'company_new_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+    ]
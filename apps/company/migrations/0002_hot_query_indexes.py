@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built with CREATE INDEX CONCURRENTLY, which cannot run in a transaction,
+    # so writes to these tables are not blocked while they build.
+    atomic = False
+
+    dependencies = [
+        ('company', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='new',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-published_at'], name='news_active_published_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='new',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='news_active_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='newtranslation',
+            index=models.Index(fields=['master', 'language_code'], name='news_tr_master_idx'),
+        ),
+    ]
@@ -1,17 +1,12 @@
-import asyncio
-import inspect
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
-from googletrans import Translator
 
-from apps.categories.models import BaseModel
+from apps.categories.models import BaseModel, translation_meta
+from apps.shared.mixins import TranslatableAutoFillMixin
 
 
-translator = Translator()
-
-
-class Company(TranslatableModel, BaseModel):
+class Company(TranslatableAutoFillMixin, TranslatableModel, BaseModel):
     """Company information"""
     translations = TranslatedFields(
         name=models.CharField(max_length=255, blank=True, null=True),
@@ -25,6 +20,8 @@ class Company(TranslatableModel, BaseModel):
     email = models.EmailField(blank=True, null=True)
     website = models.URLField(max_length=2000, blank=True, null=True)
 
+    auto_translate_fields = ('name', 'address')
+
     class Meta:
         verbose_name = _("Company")
         verbose_name_plural = _("Companies")
@@ -32,43 +29,6 @@ class Company(TranslatableModel, BaseModel):
     def __str__(self):
         return self.safe_translation_getter('name', any_language=True) or "Company"
 
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-
-        base_lang = 'uz'
-        target_langs = ['en', 'ru']
-
-        try:
-            base_translation = self.translations.get(language_code=base_lang)
-        except Exception as e:
-            print(f"⚠️ No base translation found for {base_lang}: {e}")
-            return
-
-        for lang in target_langs:
-            try:
-                if self.translations.filter(language_code=lang).exists():
-                    continue
-
-                def translate_field(text):
-                    if not text:
-                        return ""
-                    res = translator.translate(text, src=base_lang, dest=lang)
-                    if inspect.isawaitable(res):
-                        return asyncio.run(res).text
-                    return res.text
-
-                translated_name = translate_field(base_translation.name)
-                translated_address = translate_field(base_translation.address)
-
-                self.create_translation(
-                    language_code=lang,
-                    name=translated_name,
-                    address=translated_address,
-                )
-                print(f"✅ Translated {lang}: {translated_name}")
-            except Exception as e:
-                print(f"❌ Translation failed for {lang}: {e}")
-
 
 class Partners(models.Model):
     """Company partners"""
@@ -132,13 +92,14 @@ class Connection(BaseModel):
 
 
 
-class New(BaseModel, TranslatableModel):
+class New(TranslatableAutoFillMixin, BaseModel, TranslatableModel):
     news_type = (
         ('news_product', 'Yangi mahsulot'),
         ('event', 'Tadbir'),
     )
     """News model"""
     translations = TranslatedFields(
+        meta=translation_meta('news'),
         title=models.CharField(max_length=255, blank=True, null=True),
         summary=models.TextField(blank=True, null=True),
         description=models.TextField(blank=True, null=True),
@@ -149,11 +110,22 @@ class New(BaseModel, TranslatableModel):
     is_active = models.BooleanField(default=True)
     published_at = models.DateTimeField(blank=True, null=True)
     new_type = models.CharField(max_length=255, choices=news_type , default='event')    
+
+    auto_translate_fields = ('title', 'summary', 'description')
  
     class Meta:
         verbose_name = _("News")
         verbose_name_plural = _("News")
         ordering = ['-published_at']
+        indexes = [
+            # Only active news are listed: by publication date, and by the cursor pagination's ordering.
+            models.Index(
+                fields=['-published_at'], condition=models.Q(is_active=True), name='news_active_published_idx',
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], condition=models.Q(is_active=True), name='news_active_created_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.safe_translation_getter('title', any_language=True) or "News"
@@ -162,42 +134,7 @@ class New(BaseModel, TranslatableModel):
         super().save(*args, **kwargs)
 
         base_lang = 'uz'
-        target_langs = ['en', 'ru']
 
-
-        try:
-            base_translation = self.translations.get(language_code=base_lang)
-        except Exception as e:
-            print(f"⚠️ No base translation found for {base_lang}: {e}")
-            return
-
-        for lang in target_langs:
-            try:
-                if self.translations.filter(language_code=lang).exists():
-                    continue
-
-                def translate_field(text):
-                    if not text:
-                        return ""
-                    res = translator.translate(text, src=base_lang, dest=lang)
-                    if inspect.isawaitable(res):
-                        return asyncio.run(res).text
-                    return res.text
-
-                translated_title = translate_field(base_translation.title)
-                translated_summary = translate_field(base_translation.summary)
-                translated_description = translate_field(base_translation.description)
-
-                self.create_translation(
-                    language_code=lang,
-                    title=translated_title,
-                    summary=translated_summary,
-                    description=translated_description,
-                )
-                print(f"✅ Translated {lang}: {translated_title}")
-
-            except Exception as e:
-                print(f"❌ Translation failed for {lang}: {e}")
         try:
             if not self.slug:
                 base_translation = self.translations.get(language_code=base_lang)
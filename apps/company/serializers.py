@@ -3,6 +3,7 @@ from parler_rest.serializers import TranslatableModelSerializer, TranslatedField
 from .models import BannerImages, Company, Partners, Banner, Connection, New
 from apps.categories.serializers import CategoriesWithSubcategoriesSerializer
 from apps.categories.models import Category
+from apps.shared.fieldsets import SparseFieldsetMixin
 
 
 class CompanySerializer(TranslatableModelSerializer):
@@ -68,10 +69,11 @@ class ConnectionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = New
         fields = ['id', 'title', 'slug', 'summary', 'description', 'image', 'published_at', 'new_type']
+        expandable_fields = ['description']
         read_only_fields = ['id', 'title', 'slug', 'summary', 'published_at', 'new_type']
     
     # def get_news_images(self, obj):
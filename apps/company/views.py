@@ -6,7 +6,11 @@ from .models import BannerImages, Company, New, Partners, Banner, Connection
 from .serializers import CompanySerializer, PartnersSerializer, BannerSerializer, NewsSerializer
 from apps.company.utils import send_telegram_message
 from drf_spectacular.utils import extend_schema
+from apps.shared.pagination import CreatedAtCursorPagination
+from apps.shared.response_cache import cache_response
+from apps.shared.slugs import SlugLookupMixin
 
+@cache_response(Company)
 class CompanyView(APIView):
     """Get company information"""
     def get(self, request):
@@ -15,6 +19,7 @@ class CompanyView(APIView):
         return Response(serializer.data)
 
 
+@cache_response(Partners)
 class PartnersView(APIView):
     """List all partners"""
     def get(self, request):
@@ -24,6 +29,7 @@ class PartnersView(APIView):
 
 
 
+@cache_response(Banner, BannerImages)
 class BannerView(generics.ListAPIView):
     serializer_class = BannerSerializer
     queryset = Banner.objects.filter(is_active=True)
@@ -112,10 +118,12 @@ ACCEPT_LANGUAGE_HEADER = [
     )
 ]
 
+@cache_response(New)
 class NewsListView(generics.ListAPIView):
     """List all news articles"""
     serializer_class = NewsSerializer
     permission_classes = [AllowAny]
+    pagination_class = CreatedAtCursorPagination
     @extend_schema(
             summary="List News Articles", 
             # parameters=[
@@ -136,7 +144,8 @@ class NewsListView(generics.ListAPIView):
         return New.objects.filter(is_active=True).language(lang).distinct()
 
 
-class NewsDetailView(generics.RetrieveAPIView):
+@cache_response(New)
+class NewsDetailView(SlugLookupMixin, generics.RetrieveAPIView):
     """Retrieve a specific news article by slug"""
     serializer_class = NewsSerializer
     permission_classes = [AllowAny]
@@ -149,5 +158,4 @@ class NewsDetailView(generics.RetrieveAPIView):
     
     def get_queryset(self):
         lang = self.request.GET.get('language', 'uz')
-        new = New.objects.filter(is_active=True, slug=self.kwargs['slug']).language(lang).distinct()
-        return new
+        return New.objects.filter(is_active=True).language(lang)
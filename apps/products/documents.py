@@ -0,0 +1,156 @@
+import threading
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from apps.categories.models import SubCategory
+from apps.shared.projection import translations_prefetch
+
+from .models import (Product, ProductDocument, ProductLongDesc, ProductPackageContentImages, ProductSpecs,
+                     ProductUsageItem)
+
+_pending = threading.local()
+
+
+def product_prefetches(projection_language=None, fields=None):
+    """Prefetch lookups for everything ProductSerializer reads.
+
+    With ``projection_language`` only that language's translation rows (and
+    the fallback's) are loaded; with ``fields`` (the selected ProductSerializer
+    fields) only the relations those fields render.
+    """
+    def wanted(*names):
+        return fields is None or any(name in fields for name in names)
+
+    lookups = [translations_prefetch("translations", Product, projection_language)]
+    if wanted("specs"):
+        lookups.append(translations_prefetch("specs__translations", ProductSpecs, projection_language))
+    if wanted("images", "thumbnail"):
+        lookups.append("images")
+    if wanted("package_content"):
+        lookups.append(translations_prefetch(
+            "package_content_images__translations", ProductPackageContentImages, projection_language,
+        ))
+    if wanted("long_desc"):
+        lookups.append(translations_prefetch("long_desc__translations", ProductLongDesc, projection_language))
+    if wanted("usage_media"):
+        lookups.append(translations_prefetch("usage_media__translations", ProductUsageItem, projection_language))
+        lookups.append("usage_media__images")
+    if wanted("subcategory"):
+        lookups.append(translations_prefetch("subcategory__translations", SubCategory, projection_language))
+    return lookups
+
+
+def product_detail_queryset(language_code, projection_language=None, fields=None):
+    """Products with everything ProductSerializer reads (or the selected ``fields`` read) prefetched."""
+    return (
+        Product.objects.language(language_code)
+        .prefetch_related(*product_prefetches(projection_language, fields))
+        .select_related("subcategory")
+    )
+
+
+def get_base_url(request):
+    return request.build_absolute_uri('/').rstrip('/')
+
+
+def get_product_document(product_id, language_code, base_url):
+    """Return ``(body, subcategory_id)`` of the stored JSON of a product detail, or None."""
+    return ProductDocument.objects.filter(
+        product_id=product_id, language_code=language_code, base_url=base_url,
+    ).values_list('body', 'product__subcategory_id').first()
+
+
+def _save_documents(documents):
+    ProductDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=['product', 'language_code', 'base_url'],
+        update_fields=['body', 'updated_at'],
+    )
+
+
+def store_product_document(product, language_code, base_url, data):
+    _save_documents([ProductDocument(
+        product=product,
+        language_code=language_code,
+        base_url=base_url,
+        body=JSONRenderer().render(data).decode('utf-8'),
+    )])
+
+
+def _render_request(base_url, language_code):
+    # Outside a request, serialize as if the site was hit at BASE_URL so image URLs come out absolute.
+    parts = urlsplit(base_url)
+    django_request = RequestFactory().get(
+        '/', {'lang': language_code}, HTTP_HOST=parts.netloc, secure=parts.scheme == 'https',
+    )
+    return Request(django_request)
+
+
+def rebuild_product_documents(product_ids):
+    """Re-render the documents of ``product_ids`` at ``settings.BASE_URL`` for every language.
+
+    Documents of other products in the same subcategories embed these products
+    (related products, product count) and are dropped; the detail view
+    re-renders them on their next hit.
+    """
+    from .serializers import ProductSerializer
+
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    subcategory_ids = set(
+        Product.objects.filter(pk__in=product_ids, subcategory__isnull=False).values_list('subcategory_id', flat=True)
+    )
+    ProductDocument.objects.filter(product_id__in=product_ids).delete()
+    invalidate_subcategory_documents(subcategory_ids)
+
+    base_url = str(getattr(settings, 'BASE_URL', 'https://gidrox.uz')).rstrip('/')
+    documents = []
+    for language_code, _name in settings.LANGUAGES:
+        request = _render_request(base_url, language_code)
+        products = list(product_detail_queryset(language_code).filter(pk__in=product_ids))
+        data = ProductSerializer(products, many=True, context={'request': request}).data
+        for product, item in zip(products, data):
+            documents.append(ProductDocument(
+                product=product,
+                language_code=language_code,
+                base_url=base_url,
+                body=JSONRenderer().render(item).decode('utf-8'),
+            ))
+    _save_documents(documents)
+
+
+def invalidate_subcategory_documents(subcategory_ids):
+    """Drop the documents of every product in ``subcategory_ids``."""
+    if subcategory_ids:
+        ProductDocument.objects.filter(product__subcategory_id__in=subcategory_ids).delete()
+
+
+def schedule_product_documents_rebuild(product_ids):
+    """Rebuild the documents of ``product_ids`` once the current transaction commits.
+
+    A single admin save fires many signals; ids scheduled in the same
+    transaction are rebuilt together by the last on_commit callback.
+    """
+    pending = getattr(_pending, 'tokens', None)
+    if pending is None:
+        pending = _pending.tokens = {}
+    token = object()
+    for product_id in product_ids:
+        if product_id is not None:
+            pending[product_id] = token
+    transaction.on_commit(lambda: _flush(token))
+
+
+def _flush(token):
+    pending = _pending.tokens
+    product_ids = [product_id for product_id, owner in pending.items() if owner is token]
+    for product_id in product_ids:
+        del pending[product_id]
+    rebuild_product_documents(product_ids)
@@ -0,0 +1,77 @@
+from django.conf import settings
+
+from apps.shared.pagination import CreatedAtCursorPagination
+
+from .models import Product, ProductListing
+
+FALLBACK_LANGUAGE = 'uz'
+
+
+class ProductListingCursorPagination(CreatedAtCursorPagination):
+    """Cursor pagination over ``product_listing`` rows, in the order of the covering indexes."""
+    ordering = ('-created_at', '-product_id')
+
+
+def get_listing_language(language_code):
+    return language_code if language_code in dict(settings.LANGUAGES) else FALLBACK_LANGUAGE
+
+
+def thumbnail_url(product):
+    # Images are prefetched in ProductImage.Meta.ordering, so the first one is the primary image.
+    for image in product.images.all():
+        file = image.image_desktop or image.image
+        if file:
+            return file.url
+    return ''
+
+
+def refresh_product_listings(product_ids):
+    """Rewrite the ``product_listing`` rows of ``product_ids`` for every configured language."""
+    product_ids = list(product_ids)
+    if not product_ids:
+        return
+
+    products = (
+        Product.objects.filter(pk__in=product_ids)
+        .select_related('subcategory')
+        .prefetch_related('translations', 'images')
+    )
+    rows = []
+    for product in products:
+        names = {translation.language_code: translation.name for translation in product.translations.all()}
+        fallback_name = names.get(FALLBACK_LANGUAGE) or next(iter(names.values()), '')
+        thumbnail = thumbnail_url(product)
+        subcategory = product.subcategory
+        for language_code, _name in settings.LANGUAGES:
+            rows.append(ProductListing(
+                product=product,
+                language_code=language_code,
+                name=names.get(language_code) or fallback_name,
+                slug=product.slug or '',
+                sku=product.sku or '',
+                subcategory_id=product.subcategory_id,
+                subcategory_slug=(subcategory.slug or '') if subcategory else '',
+                category_id=subcategory.category_id if subcategory else None,
+                thumbnail=thumbnail,
+                created_at=product.created_at,
+            ))
+
+    ProductListing.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['product', 'language_code'],
+        update_fields=[
+            'name', 'slug', 'sku', 'subcategory_id', 'subcategory_slug', 'category_id', 'thumbnail', 'created_at',
+        ],
+    )
+
+
+def attach_listings(objects, language_code):
+    """Set ``listing`` on every object with a ``product_id`` (TopProduct, NewArrivals) with one query."""
+    product_ids = {obj.product_id for obj in objects}
+    listings = {
+        listing.product_id: listing
+        for listing in ProductListing.objects.filter(language_code=language_code, product_id__in=product_ids)
+    }
+    for obj in objects:
+        obj.listing = listings.get(obj.product_id)
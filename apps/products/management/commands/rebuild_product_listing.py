@@ -0,0 +1 @@
+from apps.products.management.rebuild_product_listing import Command
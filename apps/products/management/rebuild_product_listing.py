@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.core.management.base import BaseCommand
+
+from apps.products.listing import refresh_product_listings
+from apps.products.models import Product, ProductListing
+
+
+@dataclass
+class Stats:
+    products: int = 0
+    rows: int = 0
+
+
+class Command(BaseCommand):
+    help = "Rebuild the flat product_listing read model (one row per product and language)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of products refreshed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        stats = Stats()
+        batch_size = options["batch_size"]
+        product_ids = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+
+        self.stdout.write(self.style.NOTICE(f"Rebuilding listing rows of {len(product_ids)} products..."))
+
+        for start in range(0, len(product_ids), batch_size):
+            refresh_product_listings(product_ids[start:start + batch_size])
+            stats.products = min(start + batch_size, len(product_ids))
+            self.stdout.write(f"  {stats.products}/{len(product_ids)}")
+
+        stats.rows = ProductListing.objects.count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done. products={products}, rows={rows}".format(
+                    products=stats.products,
+                    rows=stats.rows,
+                )
+            )
+        )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.core.management.base import BaseCommand
+
+from apps.products.models import Product, ProductSearchDocument
+from apps.products.search import refresh_search_documents
+
+
+@dataclass
+class Stats:
+    products: int = 0
+    documents: int = 0
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text/trigram search rows (ProductSearchDocument) of every product."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of products refreshed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        stats = Stats()
+        batch_size = options["batch_size"]
+        product_ids = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+
+        self.stdout.write(self.style.NOTICE(f"Rebuilding search rows of {len(product_ids)} products..."))
+
+        for start in range(0, len(product_ids), batch_size):
+            refresh_search_documents(product_ids[start:start + batch_size])
+            stats.products = min(start + batch_size, len(product_ids))
+            self.stdout.write(f"  {stats.products}/{len(product_ids)}")
+
+        stats.documents = ProductSearchDocument.objects.count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done. products={products}, documents={documents}".format(
+                    products=stats.products,
+                    documents=stats.documents,
+                )
+            )
+        )
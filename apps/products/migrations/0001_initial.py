@@ -0,0 +1,337 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+import apps.products.models
+import apps.shared.mixins
+import django.contrib.postgres.search
+import django.db.models.deletion
+import parler.fields
+import parler.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('categories', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSpecsTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Product Specs Template',
+                'verbose_name_plural': 'Product Specs Templates',
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('slug', models.SlugField(allow_unicode=True, blank=True, max_length=255, null=True, unique=True)),
+                ('unique_code', models.CharField(blank=True, default=apps.products.models.get_unique_code, max_length=50, null=True)),
+                ('sku', models.CharField(blank=True, max_length=100, null=True, unique=True)),
+                ('warranty_months', models.IntegerField(blank=True, default=12, null=True)),
+                ('subcategory', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='categories.subcategory')),
+            ],
+            options={
+                'verbose_name': 'Product',
+                'verbose_name_plural': 'Products',
+                'ordering': ['-created_at'],
+            },
+            bases=(apps.shared.mixins.TranslatableAutoFillMixin, parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='NewArrivals',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('ordering', models.PositiveIntegerField(default=0, help_text='Display order (lower numbers appear first)')),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='new_arrivals', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'New Arrival',
+                'verbose_name_plural': 'New Arrivals',
+                'ordering': ['ordering', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='products/')),
+                ('image_desktop', models.ImageField(blank=True, null=True, upload_to='products/desktop/')),
+                ('alt', models.CharField(blank=True, max_length=255)),
+                ('ordering', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='images', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'Product Image',
+                'verbose_name_plural': 'Product Images',
+                'ordering': ['ordering', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductLongDesc',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='long_desc', to='products.product', verbose_name='Product Long Description')),
+            ],
+            options={
+                'verbose_name': 'Product Long Description',
+                'verbose_name_plural': 'Product Long Descriptions',
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductPackageContentImages',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='package_content_images', to='products.product', verbose_name='Product Package Content Images')),
+            ],
+            options={
+                'verbose_name': 'Product Package Content Image',
+                'verbose_name_plural': 'Product Package Content Images',
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductSpecs',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='specs', to='products.product', verbose_name='Product Specs')),
+            ],
+            options={
+                'verbose_name': 'Product Specification',
+                'verbose_name_plural': 'Product Specifications',
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductUsageItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('media_type', models.CharField(choices=[('image', 'Image Upload'), ('external', 'Link (YouTube/Instagram)')], default='image', max_length=16)),
+                ('file', models.FileField(blank=True, help_text='Upload image or video file', null=True, upload_to='products/usage/')),
+                ('external_url', models.URLField(blank=True, help_text='YouTube yoki Instagram ning url linkini kiriting', null=True)),
+                ('ordering', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='usage_media', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'Product Usage Media',
+                'ordering': ['ordering'],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductUsageMediaImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='products/usage/')),
+                ('ordering', models.PositiveIntegerField(default=0)),
+                ('usage_item', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='images', to='products.productusageitem')),
+            ],
+            options={
+                'verbose_name': 'Product Usage Media Image',
+                'verbose_name_plural': 'Product Usage Media Images',
+                'ordering': ['ordering', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TopProduct',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('ordering', models.PositiveIntegerField(default=0, help_text='Display order (lower numbers appear first)')),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='top_products', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'Top Product',
+                'verbose_name_plural': 'Top Products',
+                'ordering': ['ordering', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(max_length=15)),
+                ('base_url', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='documents', to='products.product')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('product', 'language_code', 'base_url'), name='unique_product_document')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductListing',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(max_length=15)),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('slug', models.CharField(blank=True, max_length=255)),
+                ('sku', models.CharField(blank=True, max_length=100)),
+                ('subcategory_id', models.BigIntegerField(blank=True, null=True)),
+                ('subcategory_slug', models.CharField(blank=True, max_length=255)),
+                ('category_id', models.BigIntegerField(blank=True, null=True)),
+                ('thumbnail', models.CharField(blank=True, max_length=500)),
+                ('created_at', models.DateTimeField()),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='listings', to='products.product')),
+            ],
+            options={
+                'db_table': 'product_listing',
+                'indexes': [models.Index(fields=['language_code', '-created_at', '-product'], include=('id', 'name', 'slug', 'sku', 'subcategory_id', 'subcategory_slug', 'category_id', 'thumbnail'), name='product_listing_recent_idx'), models.Index(fields=['language_code', 'subcategory_id', '-created_at', '-product'], include=('id', 'name', 'slug', 'sku', 'subcategory_id', 'subcategory_slug', 'category_id', 'thumbnail'), name='product_listing_subcat_idx'), models.Index(fields=['language_code', 'subcategory_slug', '-created_at', '-product'], include=('id', 'name', 'slug', 'sku', 'subcategory_id', 'subcategory_slug', 'category_id', 'thumbnail'), name='product_listing_subslug_idx')],
+                'constraints': [models.UniqueConstraint(fields=('product', 'language_code'), name='unique_product_listing')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductLongDescTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('long_desc', models.TextField(blank=True, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='products.productlongdesc')),
+            ],
+            options={
+                'verbose_name': 'Product Long Description Translation',
+                'db_table': 'products_productlongdesc_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductPackageContentImagesTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('image', models.ImageField(blank=True, null=True, upload_to='products/package_content/')),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='products.productpackagecontentimages')),
+            ],
+            options={
+                'verbose_name': 'Product Package Content Image Translation',
+                'db_table': 'products_productpackagecontentimages_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(max_length=15)),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('sku', models.CharField(blank=True, max_length=100)),
+                ('vector', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to='products.product')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('product', 'language_code'), name='unique_product_search_document')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSpecsTemplateTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('specs', models.JSONField(blank=True, null=True, verbose_name='Specifications Template')),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='products.productspecstemplate')),
+            ],
+            options={
+                'verbose_name': 'Product Specs Template Translation',
+                'db_table': 'products_productspecstemplate_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductSpecsTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('specs', models.JSONField(blank=True, null=True, verbose_name='Specifications')),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='products.productspecs')),
+            ],
+            options={
+                'verbose_name': 'Product Specification Translation',
+                'db_table': 'products_productspecs_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'Product Translation',
+                'db_table': 'products_product_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductUsageItemTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('caption', models.TextField(blank=True, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='products.productusageitem')),
+            ],
+            options={
+                'verbose_name': 'Product Usage Media Translation',
+                'db_table': 'products_productusageitem_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built with CREATE INDEX CONCURRENTLY, which cannot run in a transaction,
+    # so writes to these tables are not blocked while they build.
+    atomic = False
+
+    dependencies = [
+        ('categories', '0002_hot_query_indexes'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        # gin_trgm_ops of product_search_trgm_idx.
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='newarrivals',
+            index=models.Index(fields=['ordering', '-created_at'], name='new_arrival_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(fields=['-created_at', '-id'], name='product_recent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(fields=['subcategory', '-created_at', '-id'], name='product_subcat_recent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productimage',
+            index=models.Index(fields=['product', 'ordering', 'id'], name='product_image_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productlongdesctranslation',
+            index=models.Index(fields=['master', 'language_code'], name='long_desc_tr_master_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productpackagecontentimagestranslation',
+            index=models.Index(fields=['master', 'language_code'], name='package_image_tr_master_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productsearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['vector'], name='product_search_vector_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productsearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('sku'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='product_search_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productspecstranslation',
+            index=models.Index(fields=['master', 'language_code'], name='specs_tr_master_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='producttranslation',
+            index=models.Index(fields=['master', 'language_code'], name='product_tr_master_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productusageitemtranslation',
+            index=models.Index(fields=['master', 'language_code'], name='usage_item_tr_master_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productusagemediaimage',
+            index=models.Index(fields=['usage_item', 'ordering', 'id'], name='usage_image_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='topproduct',
+            index=models.Index(fields=['ordering', '-created_at'], name='top_product_order_idx'),
+        ),
+    ]
@@ -1,25 +1,24 @@
-import asyncio
-import inspect
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
-from googletrans import Translator
 from django.utils.text import slugify
 from django_json_widget.widgets import JSONEditorWidget
 import uuid
 
-from apps.categories.models import SubCategory, BaseModel
-
-
-translator = Translator()
+from apps.categories.models import SubCategory, BaseModel, translation_meta
+from apps.shared.mixins import TranslatableAutoFillMixin
 
 
 def get_unique_code():
     return str(uuid.uuid4().int)[:4]
 
 
-class Product(TranslatableModel, BaseModel):
+class Product(TranslatableAutoFillMixin, TranslatableModel, BaseModel):
     translations = TranslatedFields(
+        meta=translation_meta('product'),
         name=models.CharField(max_length=255),
         description=models.TextField(blank=True),
     )
@@ -36,10 +35,17 @@ class Product(TranslatableModel, BaseModel):
     warranty_months = models.IntegerField(blank=True, null=True, default=12)
     subcategory = models.ForeignKey(SubCategory, on_delete=models.CASCADE, blank=True, null=True)
 
+    auto_translate_fields = ('name', 'description')
+
     class Meta:
         verbose_name = _("Product")
         verbose_name_plural = _("Products")
         ordering = ['-created_at']
+        indexes = [
+            # CreatedAtCursorPagination pages, over all products and per subcategory.
+            models.Index(fields=['-created_at', '-id'], name='product_recent_idx'),
+            models.Index(fields=['subcategory', '-created_at', '-id'], name='product_subcat_recent_idx'),
+        ]
 
     def __str__(self):
         return self.safe_translation_getter('name') or 'Unnamed Product'
@@ -57,43 +63,109 @@ class Product(TranslatableModel, BaseModel):
 
         super().save(*args, **kwargs)
 
-        target_langs = ['en', 'ru']
-
-        # Logic to auto-translate name/description if missing
-        try:
-            # force fetch from db or cache
-            base_translation = self.translations.get(language_code=base_lang)
-        except Exception as e:
-            # If we just saved it, it might be in memory? 
-            # If base translation is missing in DB, we can't translate to others.
-            return
-
-        for lang in target_langs:
-            if self.translations.filter(language_code=lang).exists():
-                continue
-            try:
-                res_name = translator.translate(base_translation.name, src=base_lang, dest=lang)
-                if inspect.isawaitable(res_name):
-                    translated_name = asyncio.run(res_name).text
-                else:
-                    translated_name = res_name.text
-
-                res_desc = translator.translate(base_translation.description, src=base_lang, dest=lang)
-                if inspect.isawaitable(res_desc):
-                    translated_desc = asyncio.run(res_desc).text
-                else:
-                    translated_desc = res_desc.text
-
-                # Slug is now shared, no need to translate it.
-
-                self.create_translation(
-                    language_code=lang,
-                    name=translated_name,
-                    description=translated_desc,
-                )
-                print(f"✅ Translated {lang}: {translated_name}")
-            except Exception as e:
-                print(f"❌ Translation failed for {lang}: {e}")
+
+class ProductSearchDocument(models.Model):
+    """Per-language search row of a product, kept in sync by ``apps.products.search``.
+
+    Every product has a row in each configured language; until the product is
+    translated into it, the row holds the uz (else any) translation.
+    ``vector`` is a weighted tsvector over name (A), sku (A) and description (B)
+    built with the text search configuration of the row's language. The
+    trigram index serves substring matches (partial SKUs, words the stemmer
+    does not know) through ``icontains``.
+    """
+    product = models.ForeignKey(Product, related_name='search_documents', on_delete=models.CASCADE)
+    language_code = models.CharField(max_length=15)
+    name = models.CharField(max_length=255, blank=True)
+    description = models.TextField(blank=True)
+    sku = models.CharField(max_length=100, blank=True)
+    vector = SearchVectorField(null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'language_code'], name='unique_product_search_document'),
+        ]
+        indexes = [
+            GinIndex(fields=['vector'], name='product_search_vector_idx'),
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                OpClass(Upper('sku'), name='gin_trgm_ops'),
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='product_search_trgm_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.language_code})"
+
+
+class ProductDocument(models.Model):
+    """Pre-rendered ProductSerializer JSON served by ProductDetailView, maintained by ``apps.products.documents``.
+
+    Image URLs are absolute, so a document is only valid for the ``base_url``
+    (scheme and host) it was rendered for.
+    """
+    product = models.ForeignKey(Product, related_name='documents', on_delete=models.CASCADE)
+    language_code = models.CharField(max_length=15)
+    base_url = models.CharField(max_length=255)
+    body = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['product', 'language_code', 'base_url'], name='unique_product_document',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} ({self.language_code}, {self.base_url})"
+
+
+# Columns carried by the product_listing indexes so card pages need no heap access.
+LISTING_CARD_COLUMNS = ['id', 'name', 'slug', 'sku', 'subcategory_id', 'subcategory_slug', 'category_id', 'thumbnail']
+
+
+class ProductListing(models.Model):
+    """Flat per-language card data of a product, maintained by ``apps.products.listing``.
+
+    Listing pages (``?view=card``) read this table alone: subcategory and
+    category are plain ids, names and slugs are copied, and the indexes carry
+    every card column so pages come from index-only scans.
+    """
+    product = models.ForeignKey(Product, related_name='listings', on_delete=models.CASCADE)
+    language_code = models.CharField(max_length=15)
+    name = models.CharField(max_length=255, blank=True)
+    slug = models.CharField(max_length=255, blank=True)
+    sku = models.CharField(max_length=100, blank=True)
+    subcategory_id = models.BigIntegerField(blank=True, null=True)
+    subcategory_slug = models.CharField(max_length=255, blank=True)
+    category_id = models.BigIntegerField(blank=True, null=True)
+    thumbnail = models.CharField(max_length=500, blank=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'product_listing'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'language_code'], name='unique_product_listing'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['language_code', '-created_at', '-product'],
+                include=LISTING_CARD_COLUMNS, name='product_listing_recent_idx',
+            ),
+            models.Index(
+                fields=['language_code', 'subcategory_id', '-created_at', '-product'],
+                include=LISTING_CARD_COLUMNS, name='product_listing_subcat_idx',
+            ),
+            models.Index(
+                fields=['language_code', 'subcategory_slug', '-created_at', '-product'],
+                include=LISTING_CARD_COLUMNS, name='product_listing_subslug_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.language_code})"
 
 
 class ProductImage(BaseModel):
@@ -105,6 +177,7 @@ class ProductImage(BaseModel):
 
     class Meta:
         ordering = ['ordering', 'id']
+        indexes = [models.Index(fields=['product', 'ordering', 'id'], name='product_image_order_idx')]
         verbose_name = _("Product Image")
         verbose_name_plural = _("Product Images")
 
@@ -114,6 +187,7 @@ class ProductImage(BaseModel):
 
 class ProductLongDesc(TranslatableModel, BaseModel):
     translations = TranslatedFields(
+        meta=translation_meta('long_desc'),
         long_desc=models.TextField(blank=True, null=True),
     )
 
@@ -138,6 +212,7 @@ class ProductLongDesc(TranslatableModel, BaseModel):
 
 class ProductPackageContentImages(TranslatableModel, BaseModel):
     translations = TranslatedFields(
+        meta=translation_meta('package_image'),
         image=models.ImageField(upload_to='products/package_content/', blank=True, null=True)
     )
 
@@ -161,6 +236,7 @@ class ProductPackageContentImages(TranslatableModel, BaseModel):
 class ProductSpecs(TranslatableModel, BaseModel):
     """Product specifications stored as JSON"""
     translations = TranslatedFields(
+        meta=translation_meta('specs'),
         specs=models.JSONField(_("Specifications"), encoder=None, decoder=None, blank=True, null=True)
     )
 
@@ -212,6 +288,7 @@ class TopProduct(BaseModel):
         verbose_name = _("Top Product")
         verbose_name_plural = _("Top Products")
         ordering = ['ordering', '-created_at']
+        indexes = [models.Index(fields=['ordering', '-created_at'], name='top_product_order_idx')]
 
     def __str__(self):
         return f"Top Product: {self.product}"
@@ -226,6 +303,7 @@ class NewArrivals(BaseModel):
         verbose_name = _("New Arrival")
         verbose_name_plural = _("New Arrivals")
         ordering = ['ordering', '-created_at']
+        indexes = [models.Index(fields=['ordering', '-created_at'], name='new_arrival_order_idx')]
 
     def __str__(self):
         return f"New Arrival: {self.product}"
@@ -236,6 +314,7 @@ class ProductUsageItem(TranslatableModel, BaseModel):
     """Flexible usage item: handles image, video, or social links"""
     
     translations = TranslatedFields(
+        meta=translation_meta('usage_item'),
         caption=models.TextField(blank=True, null=True),
     )
 
@@ -283,6 +362,7 @@ class ProductUsageMediaImage(BaseModel):
 
     class Meta:
         ordering = ['ordering', 'id']
+        indexes = [models.Index(fields=['usage_item', 'ordering', 'id'], name='usage_image_order_idx')]
         verbose_name = _('Product Usage Media Image')
         verbose_name_plural = _('Product Usage Media Images')
 
@@ -0,0 +1,111 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+from django.utils.html import strip_tags
+
+from .models import Product, ProductSearchDocument
+
+# PostgreSQL ships no Uzbek dictionary; languages not listed use 'simple'
+# (lower-cased, unstemmed tokens).
+SEARCH_CONFIGS = {
+    'en': 'english',
+    'ru': 'russian',
+}
+DEFAULT_SEARCH_CONFIG = 'simple'
+FALLBACK_LANGUAGE = 'uz'
+
+
+def get_search_config(language_code):
+    return SEARCH_CONFIGS.get(language_code, DEFAULT_SEARCH_CONFIG)
+
+
+def _source_translation(translations, language_code):
+    """The translation a search row in ``language_code`` is built from: its own, else uz, else any."""
+    by_language = {translation.language_code: translation for translation in translations}
+    for code in (language_code, FALLBACK_LANGUAGE):
+        if code in by_language:
+            return by_language[code]
+    return min(translations, key=lambda translation: translation.language_code, default=None)
+
+
+def refresh_search_documents(product_ids):
+    """Rebuild the search rows of ``product_ids`` from their current translations.
+
+    Every product gets a row in every configured language; a language it is
+    not translated into yet holds the uz (else any) translation, so a search
+    only ever reads the rows of the requested language.
+    """
+    product_ids = list(product_ids)
+    if not product_ids:
+        return
+
+    products = Product.objects.filter(pk__in=product_ids).prefetch_related('translations')
+    language_codes = [code for code, _name in settings.LANGUAGES]
+    documents = []
+    for product in products:
+        translations = list(product.translations.all())
+        for language_code in language_codes:
+            translation = _source_translation(translations, language_code)
+            documents.append(ProductSearchDocument(
+                product=product,
+                language_code=language_code,
+                name=(translation and translation.name) or '',
+                description=strip_tags((translation and translation.description) or ''),
+                sku=product.sku or '',
+            ))
+
+    ProductSearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=['product', 'language_code'],
+        update_fields=['name', 'description', 'sku'],
+    )
+
+    # Drop rows of deleted products and of languages no longer configured.
+    current = {(document.product_id, document.language_code) for document in documents}
+    stale_ids = [
+        pk for pk, product_id, language_code in ProductSearchDocument.objects.filter(
+            product_id__in=product_ids,
+        ).values_list('pk', 'product_id', 'language_code')
+        if (product_id, language_code) not in current
+    ]
+    if stale_ids:
+        ProductSearchDocument.objects.filter(pk__in=stale_ids).delete()
+
+    for language_code in {document.language_code for document in documents}:
+        config = get_search_config(language_code)
+        ProductSearchDocument.objects.filter(product_id__in=product_ids, language_code=language_code).update(
+            vector=(
+                SearchVector('name', weight='A', config=config)
+                + SearchVector('sku', weight='A', config=config)
+                + SearchVector('description', weight='B', config=config)
+            )
+        )
+
+
+def search_products(queryset, query, language_code):
+    """Filter ``queryset`` to products matching ``query`` in ``language_code``.
+
+    Only the search rows of ``language_code`` are read (unsupported codes
+    fall back to uz); they hold the uz or any translation of products whose
+    own translation is still queued, so those stay findable. Matches the
+    full-text vector (websearch syntax) or a substring of the row's name,
+    description or sku, all served by the row's indexes, and annotates
+    ``search_rank`` for ordering. The join hits one search row per product,
+    so no ``distinct()`` is needed.
+    """
+    if language_code not in dict(settings.LANGUAGES):
+        language_code = FALLBACK_LANGUAGE
+    search_query = SearchQuery(query, config=get_search_config(language_code), search_type='websearch')
+    return queryset.filter(
+        Q(search_documents__vector=search_query)
+        | Q(search_documents__name__icontains=query)
+        | Q(search_documents__description__icontains=query)
+        | Q(search_documents__sku__icontains=query),
+        search_documents__language_code=language_code,
+    ).annotate(
+        # ts_rank returns a real; as double precision the value survives the
+        # round trip through a pagination cursor exactly.
+        search_rank=Cast(SearchRank(F('search_documents__vector'), search_query), FloatField()),
+    )
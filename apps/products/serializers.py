@@ -1,17 +1,67 @@
+from django.db import models
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
 from rest_framework import serializers
 from parler_rest.serializers import TranslatableModelSerializer, TranslatedFieldsField
 from .models import (
     Product, ProductImage, ProductLongDesc, 
     ProductPackageContentImages, ProductSpecs, TopProduct, NewArrivals, 
-    ProductUsageItem, ProductUsageMediaImage
+    ProductUsageItem, ProductUsageMediaImage, ProductListing
 )
+from .listing import attach_listings, get_listing_language, thumbnail_url
 from apps.categories.serializers import SubCategorySerializer
+from apps.shared.fieldsets import SparseFieldsetMixin
+from apps.shared.fragments import FragmentCacheMixin, FragmentListSerializer
+from apps.shared.projection import LanguageProjectionMixin, projection_language, translations_prefetch
+
+RELATED_PRODUCTS_LIMIT = 4
+
+
+def attach_related_products(products, limit=RELATED_PRODUCTS_LIMIT, language_code=None):
+    """Set ``_related_products`` on every product with one windowed query.
+
+    Related products are the newest ``limit`` other products of the same
+    subcategory. ROW_NUMBER() over each subcategory keeps ``limit + 1`` rows
+    per subcategory, enough to still have ``limit`` once the product itself
+    is dropped. With ``language_code`` only that language's translations are
+    loaded (see :func:`apps.shared.projection.translations_prefetch`).
+    """
+    if not products:
+        return
+    subcategory_ids = {product.subcategory_id for product in products}
+    in_subcategories = Q(subcategory_id__in=subcategory_ids - {None})
+    if None in subcategory_ids:
+        in_subcategories |= Q(subcategory__isnull=True)
+
+    candidates = (
+        Product.objects.filter(in_subcategories)
+        .annotate(row_number=Window(
+            RowNumber(),
+            partition_by=[F('subcategory_id')],
+            order_by=[F('created_at').desc(), F('id').desc()],
+        ))
+        .filter(row_number__lte=limit + 1)
+        .order_by('subcategory_id', 'row_number')
+        .prefetch_related(translations_prefetch('translations', Product, language_code), 'images')
+    )
+
+    by_subcategory = {}
+    for candidate in candidates:
+        by_subcategory.setdefault(candidate.subcategory_id, []).append(candidate)
+
+    for product in products:
+        related = [
+            candidate for candidate in by_subcategory.get(product.subcategory_id, [])
+            if candidate.pk != product.pk
+        ]
+        product._related_products = related[:limit]
 
 
-class ProductImageSerializer(serializers.ModelSerializer):
+class ProductImageSerializer(FragmentCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = ProductImage
         fields = ['id', 'product', 'image', 'image_desktop', 'alt', 'ordering']
+        list_serializer_class = FragmentListSerializer
 
 
 class ProductPackageContentImagesSerializer(serializers.ModelSerializer):
@@ -22,7 +72,7 @@ class ProductPackageContentImagesSerializer(serializers.ModelSerializer):
         fields = ['id', 'image']
 
 
-class ProductLongDescSerializer(TranslatableModelSerializer):
+class ProductLongDescSerializer(LanguageProjectionMixin, TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=ProductLongDesc)
 
     class Meta:
@@ -30,7 +80,7 @@ class ProductLongDescSerializer(TranslatableModelSerializer):
         fields = ['id', 'product', 'translations']
 
 
-class ProductSpecsSerializer(TranslatableModelSerializer):
+class ProductSpecsSerializer(LanguageProjectionMixin, TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=ProductSpecs)
 
     class Meta:
@@ -38,7 +88,7 @@ class ProductSpecsSerializer(TranslatableModelSerializer):
         fields = ['id', 'product', 'translations']
 
 
-class RelatedProductSerializer(TranslatableModelSerializer):
+class RelatedProductSerializer(FragmentCacheMixin, LanguageProjectionMixin, TranslatableModelSerializer):
     """Simplified product serializer for related products"""
     translations = TranslatedFieldsField(shared_model=Product)
     images = ProductImageSerializer(many=True, read_only=True)
@@ -46,8 +96,9 @@ class RelatedProductSerializer(TranslatableModelSerializer):
     class Meta:
         model = Product
         fields = ['id', 'translations', 'slug', 'sku', 'images']
+        list_serializer_class = FragmentListSerializer
 
-class ProductUsageItemSerializer(serializers.ModelSerializer):
+class ProductUsageItemSerializer(LanguageProjectionMixin, serializers.ModelSerializer):
     translations = TranslatedFieldsField(shared_model=ProductUsageItem)
     images = serializers.SerializerMethodField()
 
@@ -67,9 +118,24 @@ class ProductUsageMediaImageSerializer(serializers.ModelSerializer):
         fields = ['id', 'image', 'ordering']
 
 
-class ProductSerializer(TranslatableModelSerializer):
-    """Full product serializer with all related data"""
+class ProductListSerializer(serializers.ListSerializer):
+    """Loads the related products of a whole page at once (when they are rendered)."""
+
+    def to_representation(self, data):
+        products = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        if 'related_products' in self.child.fields:
+            attach_related_products(products, language_code=projection_language(self.context.get('request')))
+        return super().to_representation(products)
+
+
+class ProductSerializer(SparseFieldsetMixin, LanguageProjectionMixin, TranslatableModelSerializer):
+    """Full product serializer with all related data
+
+    Supports `?fields=` (e.g. `fields=id,name,slug,thumbnail`) and `?expand=`
+    (e.g. `expand=specs`), see :class:`apps.shared.fieldsets.SparseFieldsetMixin`.
+    """
     related_products = serializers.SerializerMethodField()
+    thumbnail = serializers.SerializerMethodField()
     package_content = serializers.SerializerMethodField()
     long_desc = ProductLongDescSerializer(many=True, read_only=True)
     translations = TranslatedFieldsField(shared_model=Product)
@@ -83,17 +149,28 @@ class ProductSerializer(TranslatableModelSerializer):
         fields = [
             'id', 'translations', 'slug', 'sku', 'warranty_months', 'package_content',
             'images', 'specs', 'subcategory',
-            'related_products', 'long_desc', 'usage_media'
+            'related_products', 'long_desc', 'usage_media', 'thumbnail'
         ]
+        expandable_fields = ['package_content', 'specs', 'subcategory', 'related_products', 'long_desc', 'usage_media']
+        on_demand_fields = ['thumbnail']
+        list_serializer_class = ProductListSerializer
 
     def get_related_products(self, obj):
-        qs = Product.objects.filter(subcategory=obj.subcategory).exclude(id=obj.id)[:4]
-        return RelatedProductSerializer(qs, many=True, context=self.context).data
-        
+        if not hasattr(obj, '_related_products'):
+            attach_related_products([obj], language_code=projection_language(self.context.get('request')))
+        return RelatedProductSerializer(obj._related_products, many=True, context=self.context).data
+
     def get_package_content(self, obj):
         qs = obj.package_content_images.all()
         return ProductPackageContentImagesSerializer(qs, many=True, context=self.context).data
 
+    def get_thumbnail(self, obj):
+        url = thumbnail_url(obj)
+        request = self.context.get('request')
+        if url and request is not None:
+            return request.build_absolute_uri(url)
+        return url or None
+
 class TopProductListSerializer(serializers.ModelSerializer):
     """Serializer for listing top products with minimal data"""
     product = RelatedProductSerializer(read_only=True)
@@ -120,6 +197,61 @@ class NewArrivalsListSerializer(serializers.ModelSerializer):
         return ProductPackageContentImagesSerializer(qs, many=True, context=self.context).data
 
 
+class ProductCardSerializer(serializers.ModelSerializer):
+    """Card data of a product read from the flat ``product_listing`` table"""
+    id = serializers.IntegerField(source='product_id', read_only=True)
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProductListing
+        fields = [
+            'id', 'name', 'slug', 'sku', 'subcategory_id', 'subcategory_slug', 'category_id',
+            'thumbnail', 'created_at',
+        ]
+
+    def get_thumbnail(self, obj):
+        request = self.context.get('request')
+        if obj.thumbnail and request is not None:
+            return request.build_absolute_uri(obj.thumbnail)
+        return obj.thumbnail or None
+
+
+class ListingEntryListSerializer(serializers.ListSerializer):
+    """Loads the card rows of all entries with one query."""
+
+    def to_representation(self, data):
+        entries = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        request = self.context.get('request')
+        lang = request.query_params.get('lang', 'uz') if request is not None else 'uz'
+        attach_listings(entries, get_listing_language(lang))
+        return super().to_representation(entries)
+
+
+class ListingEntryCardSerializer(serializers.ModelSerializer):
+    """TopProduct / NewArrivals entry with the product as card data"""
+    product = serializers.SerializerMethodField()
+
+    class Meta:
+        fields = ['id', 'product', 'ordering']
+        list_serializer_class = ListingEntryListSerializer
+
+    def get_product(self, obj):
+        listing = getattr(obj, 'listing', None)
+        if listing is None:
+            return None
+        return ProductCardSerializer(listing, context=self.context).data
+
+
+class TopProductCardSerializer(ListingEntryCardSerializer):
+    class Meta(ListingEntryCardSerializer.Meta):
+        model = TopProduct
+
+
+class NewArrivalsCardSerializer(ListingEntryCardSerializer):
+    class Meta(ListingEntryCardSerializer.Meta):
+        model = NewArrivals
+
+
 # class TopProductsSerializer(ProductSerializer):
 
 #     class Meta:
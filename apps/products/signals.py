@@ -1,11 +1,20 @@
 
 from django.db import transaction
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
+from apps.categories.models import Category, SubCategory
 from apps.company.middleware import get_logger
-
-from .models import ProductImage
+from apps.shared.fragments import touch, touch_parent_on_change
+from apps.shared.signals import translations_bulk_created
+
+from .documents import invalidate_subcategory_documents, schedule_product_documents_rebuild
+from .listing import refresh_product_listings
+from .models import (Product, ProductImage, ProductLongDesc, ProductPackageContentImages,
+                     ProductSpecs, ProductUsageItem, ProductUsageMediaImage)
+from .search import refresh_search_documents
+from .suggest import invalidate_suggest_index
 from .utils import compress_image
 
 logger = get_logger()
@@ -32,7 +41,9 @@ def _compress_product_image(instance: ProductImage) -> None:
         instance.image_desktop.save(image_desktop.name, image_desktop, save=False)
         ProductImage.objects.filter(pk=instance.pk).update(
             image_desktop=instance.image_desktop,
+            updated_at=timezone.now(),
         )
+        touch(Product, [instance.product_id])
 
         old_paths = {
             'original': getattr(instance, '_old_image', None),
@@ -82,3 +93,133 @@ def compress_product_image_after_save(sender, instance, created, **kwargs):
         return
 
     transaction.on_commit(lambda: _compress_product_image(instance))
+
+
+ProductTranslation = Product._parler_meta.root_model
+
+
+def _schedule_search_refresh(product_ids):
+    transaction.on_commit(lambda: refresh_search_documents(product_ids))
+
+
+@receiver(post_save, sender=Product)
+def refresh_search_after_product_save(sender, instance, **kwargs):
+    _schedule_search_refresh([instance.pk])
+
+
+@receiver(post_save, sender=ProductTranslation)
+@receiver(post_delete, sender=ProductTranslation)
+def refresh_search_after_translation_change(sender, instance, **kwargs):
+    _schedule_search_refresh([instance.master_id])
+
+
+@receiver(translations_bulk_created, sender=Product)
+def refresh_search_after_bulk_translations(sender, master_ids, **kwargs):
+    _schedule_search_refresh(master_ids)
+
+
+def _invalidate_suggest_index(sender, **kwargs):
+    transaction.on_commit(invalidate_suggest_index)
+
+
+for _model in (Category, SubCategory, Product):
+    for _sender in (_model, _model._parler_meta.root_model):
+        post_save.connect(_invalidate_suggest_index, sender=_sender, dispatch_uid=f'suggest_{_sender._meta.label_lower}_save')
+        post_delete.connect(_invalidate_suggest_index, sender=_sender, dispatch_uid=f'suggest_{_sender._meta.label_lower}_delete')
+    translations_bulk_created.connect(_invalidate_suggest_index, sender=_model, dispatch_uid=f'suggest_{_model._meta.label_lower}_bulk')
+
+
+# Models whose rows are rendered into ProductDocument, with the way to their product.
+DOCUMENT_SOURCES = {
+    Product: lambda instance: instance.pk,
+    ProductTranslation: lambda instance: instance.master_id,
+    ProductImage: lambda instance: instance.product_id,
+    ProductUsageMediaImage: lambda instance: (
+        ProductUsageItem.objects.filter(pk=instance.usage_item_id).values_list('product_id', flat=True).first()
+    ),
+}
+for _model in (ProductSpecs, ProductLongDesc, ProductUsageItem, ProductPackageContentImages):
+    DOCUMENT_SOURCES[_model] = lambda instance: instance.product_id
+    DOCUMENT_SOURCES[_model._parler_meta.root_model] = (
+        lambda instance, _model=_model: _model.objects.filter(pk=instance.master_id).values_list('product_id', flat=True).first()
+    )
+
+
+def _rebuild_product_document(sender, instance, **kwargs):
+    schedule_product_documents_rebuild([DOCUMENT_SOURCES[sender](instance)])
+
+
+for _sender in DOCUMENT_SOURCES:
+    post_save.connect(_rebuild_product_document, sender=_sender, dispatch_uid=f'document_{_sender._meta.label_lower}_save')
+    post_delete.connect(_rebuild_product_document, sender=_sender, dispatch_uid=f'document_{_sender._meta.label_lower}_delete')
+
+
+@receiver(post_delete, sender=Product)
+def drop_sibling_documents_after_product_delete(sender, instance, **kwargs):
+    subcategory_id = instance.subcategory_id
+    transaction.on_commit(lambda: invalidate_subcategory_documents([subcategory_id]))
+
+
+@receiver(post_save, sender=SubCategory)
+@receiver(post_delete, sender=SubCategory)
+@receiver(post_save, sender=SubCategory._parler_meta.root_model)
+@receiver(post_delete, sender=SubCategory._parler_meta.root_model)
+def drop_documents_after_subcategory_change(sender, instance, **kwargs):
+    subcategory_id = instance.master_id if sender is not SubCategory else instance.pk
+    transaction.on_commit(lambda: invalidate_subcategory_documents([subcategory_id]))
+
+
+@receiver(translations_bulk_created, sender=Product)
+def rebuild_documents_after_bulk_translations(sender, master_ids, **kwargs):
+    schedule_product_documents_rebuild(master_ids)
+
+
+@receiver(translations_bulk_created, sender=SubCategory)
+def drop_documents_after_subcategory_bulk_translations(sender, master_ids, **kwargs):
+    transaction.on_commit(lambda: invalidate_subcategory_documents(master_ids))
+
+
+def _schedule_listing_refresh(product_ids):
+    transaction.on_commit(lambda: refresh_product_listings(product_ids))
+
+
+@receiver(post_save, sender=Product)
+def refresh_listing_after_product_save(sender, instance, **kwargs):
+    _schedule_listing_refresh([instance.pk])
+
+
+@receiver(post_save, sender=ProductTranslation)
+@receiver(post_delete, sender=ProductTranslation)
+def refresh_listing_after_translation_change(sender, instance, **kwargs):
+    _schedule_listing_refresh([instance.master_id])
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def refresh_listing_after_image_change(sender, instance, **kwargs):
+    if instance.product_id:
+        _schedule_listing_refresh([instance.product_id])
+
+
+@receiver(translations_bulk_created, sender=Product)
+def refresh_listing_after_bulk_translations(sender, master_ids, **kwargs):
+    _schedule_listing_refresh(master_ids)
+
+
+@receiver(post_save, sender=SubCategory)
+def refresh_listing_after_subcategory_save(sender, instance, **kwargs):
+    # Subcategory slug and category are copied into the listing rows.
+    subcategory_id = instance.pk
+    transaction.on_commit(lambda: refresh_product_listings(
+        Product.objects.filter(subcategory_id=subcategory_id).values_list('pk', flat=True)
+    ))
+
+
+# Images and translations are rendered inside the product's cached fragment.
+touch_parent_on_change(ProductImage, 'product')
+touch_parent_on_change(ProductTranslation, 'master')
+
+
+@receiver(translations_bulk_created, sender=Product)
+def touch_products_after_bulk_translations(sender, master_ids, **kwargs):
+    touch(Product, master_ids)
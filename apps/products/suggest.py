@@ -0,0 +1,118 @@
+import re
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+
+from apps.categories.models import Category, SubCategory
+from apps.shared.cache import bump_cache_version, get_cache_version
+
+from .models import Product
+
+SUGGEST_CACHE_NAMESPACE = 'suggest'
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+# Prefixes longer than this share the list of their first MAX_PREFIX_LENGTH characters.
+MAX_PREFIX_LENGTH = 20
+FALLBACK_LANGUAGE = 'uz'
+
+# Categories rank above subcategories, subcategories above products.
+SUGGEST_SOURCES = (
+    ('category', Category),
+    ('subcategory', SubCategory),
+    ('product', Product),
+)
+
+_WORD_RE = re.compile(r'\w+')
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def normalize(text):
+    return ' '.join(_WORD_RE.findall((text or '').casefold()))
+
+
+def _terms(name):
+    """The normalized full name and every suffix starting at a later word."""
+    words = normalize(name).split()
+    return [' '.join(words[i:]) for i in range(len(words))]
+
+
+def invalidate_suggest_index():
+    """Make every process rebuild its suggest index on the next lookup."""
+    bump_cache_version(SUGGEST_CACHE_NAMESPACE)
+
+
+class SuggestIndex:
+    """In-memory prefix index of category, subcategory and product names for one language.
+
+    Every prefix (up to ``MAX_PREFIX_LENGTH`` characters) of the full name and
+    of each later word maps to the best ``SUGGEST_MAX_LIMIT`` entries, so a
+    lookup is a single dict access.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        prefixes = defaultdict(set)
+        for position, entry in enumerate(entries):
+            for term in _terms(entry['name']):
+                for length in range(1, min(len(term), MAX_PREFIX_LENGTH) + 1):
+                    prefixes[term[:length]].add(position)
+
+        # Entries are pre-sorted by rank, so the lowest positions are the best matches.
+        self.prefixes = {prefix: sorted(positions)[:SUGGEST_MAX_LIMIT] for prefix, positions in prefixes.items()}
+
+    @classmethod
+    def build(cls, language_code):
+        entries = []
+        for kind, model in SUGGEST_SOURCES:
+            translation_model = model._parler_meta.root_model
+            names = {}
+            rows = translation_model.objects.filter(
+                language_code__in={language_code, FALLBACK_LANGUAGE},
+            ).values_list('master_id', 'language_code', 'name', 'master__slug')
+            for master_id, row_language, name, slug in rows:
+                if not name or not slug:
+                    continue
+                if row_language == language_code or master_id not in names:
+                    names[master_id] = (name, slug)
+            entries.extend(
+                {'type': kind, 'name': name, 'slug': slug}
+                for name, slug in sorted(names.values(), key=lambda item: (len(item[0]), item[0].casefold()))
+            )
+        return cls(entries)
+
+    def lookup(self, query, limit=SUGGEST_DEFAULT_LIMIT):
+        query = normalize(query)
+        if not query:
+            return []
+        positions = self.prefixes.get(query[:MAX_PREFIX_LENGTH], [])
+        matches = [self.entries[position] for position in positions]
+        if len(query) > MAX_PREFIX_LENGTH:
+            matches = [
+                entry for entry in matches
+                if any(term.startswith(query) for term in _terms(entry['name']))
+            ]
+        return matches[:limit]
+
+
+def get_suggest_index(language_code):
+    """Return this process' index for ``language_code``, rebuilding it when signals bumped the version."""
+    version = get_cache_version(SUGGEST_CACHE_NAMESPACE)
+    cached = _indexes.get(language_code)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _lock:
+        cached = _indexes.get(language_code)
+        if cached is None or cached[0] != version:
+            cached = _indexes[language_code] = (version, SuggestIndex.build(language_code))
+    return cached[1]
+
+
+def suggest(query, language_code, limit=SUGGEST_DEFAULT_LIMIT):
+    if language_code not in dict(settings.LANGUAGES):
+        language_code = FALLBACK_LANGUAGE
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+    return get_suggest_index(language_code).lookup(query, limit)
@@ -1,3 +1,231 @@
-from django.test import TestCase
+import os
+from unittest import skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings, tag
+from django.urls import reverse
+
+from apps.categories.models import SubCategory
+from apps.company.models import New
+
+from .models import (NewArrivals, Product, ProductImage, ProductLongDesc, ProductPackageContentImages,
+                     ProductSearchDocument, ProductSpecs, ProductUsageItem, ProductUsageMediaImage, TopProduct)
+from .search import refresh_search_documents, search_products
+
+
+def _translated(model, translated=None, **fields):
+    """Create ``model`` with an uz translation holding ``translated``."""
+    obj = model(**fields)
+    obj.set_current_language('uz')
+    for key, value in (translated or {}).items():
+        setattr(obj, key, value)
+    obj.save()
+    return obj
+
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+# The dummy cache keeps the response cache out of the way of the serialization being measured.
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class ProductDetailQueryCountTests(TestCase):
+    # 1 slug map load (no cached version to reuse) + 1 document lookup + 1 product (with subcategory)
+    # + 12 prefetches: translations, specs (+ translations), images, package content (+ translations),
+    #   long desc (+ translations), usage media (+ translations, images), subcategory translations
+    # + 3 related products (window query, translations, images) + 1 document upsert
+    LIVE_DETAIL_QUERIES = 19
+    # slug map load + document lookup
+    DOCUMENT_DETAIL_QUERIES = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.subcategory = _translated(SubCategory, translated={'name': 'Nasoslar'})
+        for i in range(3):
+            cls.product = _translated(
+                Product, sku=f'SKU-{i}', subcategory=cls.subcategory,
+                translated={'name': f'Nasos {i}', 'description': 'Tavsif'},
+            )
+
+    def _add_children(self, count):
+        for i in range(count):
+            ProductImage.objects.create(product=self.product, alt=f'image {i}')
+            _translated(ProductSpecs, product=self.product, translated={'specs': {'power': i}})
+            _translated(ProductLongDesc, product=self.product, translated={'long_desc': f'Text {i}'})
+            _translated(ProductPackageContentImages, product=self.product)
+            usage = _translated(ProductUsageItem, product=self.product, translated={'caption': f'Usage {i}'})
+            ProductUsageMediaImage.objects.create(usage_item=usage)
+
+    def _get_detail(self, num_queries=LIVE_DETAIL_QUERIES):
+        url = reverse('products:product-detail', kwargs={'slug': self.product.slug})
+        with self.assertNumQueries(num_queries):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_detail_query_count_is_fixed(self):
+        self._add_children(1)
+        data = self._get_detail()
+        self.assertEqual(len(data['related_products']), 2)
+
+    def test_detail_query_count_does_not_grow_with_related_rows(self):
+        self._add_children(4)
+        data = self._get_detail()
+        self.assertEqual(len(data['specs']), 4)
+        self.assertEqual(len(data['usage_media']), 4)
+
+    def test_detail_is_served_from_stored_document(self):
+        self._add_children(2)
+        live = self._get_detail()
+        stored = self._get_detail(self.DOCUMENT_DETAIL_QUERIES)
+        self.assertEqual(stored, live)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_detail_is_served_from_response_cache(self):
+        cache.clear()
+        self._add_children(1)
+        live = self._get_detail()
+        cached = self._get_detail(0)
+        self.assertEqual(cached, live)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_cached_document_detail_follows_edits(self):
+        self._add_children(1)
+        self._get_detail()
+        cache.clear()
+        self._get_detail(self.DOCUMENT_DETAIL_QUERIES)
+        spec = ProductSpecs.objects.get(product=self.product)
+        spec.set_current_language('uz')
+        spec.specs = {'power': 'edited'}
+        with self.captureOnCommitCallbacks(execute=True):
+            spec.save()
+        response = self.client.get(reverse('products:product-detail', kwargs={'slug': self.product.slug}))
+        self.assertEqual(response.json()['specs'][0]['translations']['uz']['specs'], {'power': 'edited'})
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_unchanged_detail_is_not_modified(self):
+        cache.clear()
+        self._add_children(1)
+        url = reverse('products:product-detail', kwargs={'slug': self.product.slug})
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+
+class ProductSearchFallbackTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Only the uz translation exists; the ru and en ones are still waiting for the translation worker.
+        cls.product = _translated(Product, sku='ZX-900', translated={'name': 'Suv nasosi'})
+        refresh_search_documents([cls.product.pk])
+
+    def _search(self, query, language_code):
+        return list(search_products(Product.objects.all(), query, language_code).values_list('pk', flat=True))
+
+    def test_missing_translation_falls_back_to_uz(self):
+        self.assertEqual(self._search('nasosi', 'ru'), [self.product.pk])
+
+    def test_every_language_has_a_search_row(self):
+        rows = ProductSearchDocument.objects.filter(product=self.product).order_by('language_code')
+        self.assertEqual(
+            list(rows.values_list('language_code', 'name', 'sku')),
+            [('en', 'Suv nasosi', 'ZX-900'), ('ru', 'Suv nasosi', 'ZX-900'), ('uz', 'Suv nasosi', 'ZX-900')],
+        )
+
+    def test_sku_matches_the_language_row(self):
+        self.assertEqual(self._search('ZX-9', 'en'), [self.product.pk])
+        ProductSearchDocument.objects.filter(product=self.product, language_code='en').update(sku='')
+        self.assertEqual(self._search('ZX-9', 'en'), [])
+        self.assertEqual(self._search('ZX-9', 'xx'), [self.product.pk])
+
+
+def _seed_catalog(count, subcategory_ids):
+    """Insert ``count`` products (3 translations, an image, a usage item with an image, a top
+    product and a new arrival entry each) and ``count`` news with set-based SQL."""
+    product = Product._meta.db_table
+    usage_item = ProductUsageItem._meta.db_table
+    statements = [
+        (f"""INSERT INTO {product} (created_at, updated_at, slug, sku, warranty_months, subcategory_id)
+             SELECT now() - i * interval '1 minute', now(), 'product-' || i, 'SKU-' || i, 12,
+                    (%s::bigint[])[1 + mod(i, %s)]
+             FROM generate_series(1, %s) AS i""", [subcategory_ids, len(subcategory_ids), count]),
+        (f"""INSERT INTO {Product._parler_meta.root_model._meta.db_table} (language_code, name, description, master_id)
+             SELECT language_code, 'Product ' || p.id, '', p.id
+             FROM {product} p CROSS JOIN unnest(ARRAY['uz', 'ru', 'en']) AS language_code""", []),
+        (f"""INSERT INTO {ProductImage._meta.db_table} (created_at, updated_at, image, image_desktop, alt, ordering, product_id)
+             SELECT now(), now(), '', '', '', 0, id FROM {product}""", []),
+        (f"""INSERT INTO {usage_item} (created_at, updated_at, media_type, ordering, product_id)
+             SELECT now(), now(), 'image', 0, id FROM {product}""", []),
+        (f"""INSERT INTO {ProductUsageMediaImage._meta.db_table} (created_at, updated_at, image, ordering, usage_item_id)
+             SELECT now(), now(), '', 0, id FROM {usage_item}""", []),
+        (f"""INSERT INTO {TopProduct._meta.db_table} (created_at, updated_at, ordering, product_id)
+             SELECT created_at, now(), mod(id, 100), id FROM {product}""", []),
+        (f"""INSERT INTO {NewArrivals._meta.db_table} (created_at, updated_at, ordering, product_id)
+             SELECT created_at, now(), mod(id, 100), id FROM {product}""", []),
+        (f"""INSERT INTO {New._meta.db_table} (created_at, updated_at, slug, image, alt, is_active, published_at, new_type)
+             SELECT now() - i * interval '1 minute', now(), 'news-' || i, '', '', mod(i, 10) <> 0,
+                    now() - i * interval '1 minute', 'event'
+             FROM generate_series(1, %s) AS i""", [count]),
+        (f"""INSERT INTO {New._parler_meta.root_model._meta.db_table} (language_code, title, master_id)
+             SELECT 'uz', 'News ' || id, id FROM {New._meta.db_table}""", []),
+    ]
+    with connection.cursor() as cursor:
+        for sql, params in statements:
+            cursor.execute(sql, params)
+        cursor.execute('ANALYZE')
+
+
+@tag('slow')
+@skipUnless(os.environ.get('RUN_SLOW_TESTS'), 'seeds 50k products; set RUN_SLOW_TESTS=1 to run')
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are checked on PostgreSQL')
+class HotQueryIndexTests(TestCase):
+    """The hot catalog queries must be served by indexes, not sequential scans, at catalog scale.
+
+    Run with ``RUN_SLOW_TESTS=1 python manage.py test --tag slow``.
+    """
+    SEED_PRODUCTS = 50_000
+    PAGE_SIZE = 21
+
+    @classmethod
+    def setUpTestData(cls):
+        subcategory_ids = [
+            _translated(SubCategory, translated={'name': f'Subcategory {i}'}).pk for i in range(50)
+        ]
+        cls.subcategory_id = subcategory_ids[0]
+        _seed_catalog(cls.SEED_PRODUCTS, subcategory_ids)
+        cls.product_ids = list(
+            Product.objects.order_by('-created_at', '-id').values_list('id', flat=True)[:cls.PAGE_SIZE]
+        )
+
+    def assertIndexScan(self, queryset):
+        plan = queryset.explain()
+        self.assertNotIn('Seq Scan', plan, f'{queryset.query}\n{plan}')
+
+    def test_product_pages(self):
+        self.assertIndexScan(Product.objects.order_by('-created_at', '-id')[:self.PAGE_SIZE])
+        self.assertIndexScan(
+            Product.objects.filter(subcategory_id=self.subcategory_id).order_by('-created_at', '-id')[:self.PAGE_SIZE]
+        )
+
+    def test_translation_prefetches(self):
+        for model, ids in ((Product, self.product_ids), (New, New.objects.values_list('id', flat=True)[:20])):
+            translations = model._parler_meta.root_model.objects
+            self.assertIndexScan(translations.filter(master_id__in=list(ids)))
+            self.assertIndexScan(translations.filter(master_id__in=list(ids), language_code__in=['ru', 'uz']))
+
+    def test_image_prefetches(self):
+        self.assertIndexScan(ProductImage.objects.filter(product_id__in=self.product_ids))
+        usage_item_ids = list(
+            ProductUsageItem.objects.filter(product_id__in=self.product_ids).values_list('id', flat=True)
+        )
+        self.assertIndexScan(ProductUsageMediaImage.objects.filter(usage_item_id__in=usage_item_ids))
+
+    def test_homepage_entries(self):
+        self.assertIndexScan(TopProduct.objects.all()[:self.PAGE_SIZE])
+        self.assertIndexScan(NewArrivals.objects.all()[:self.PAGE_SIZE])
+
+    def test_active_news(self):
+        self.assertIndexScan(New.objects.filter(is_active=True)[:self.PAGE_SIZE])
+        self.assertIndexScan(New.objects.filter(is_active=True).order_by('-created_at', '-id')[:self.PAGE_SIZE])
@@ -1,6 +1,6 @@
 from django.urls import path
 from .views import (
-    ProductListView, ProductDetailView, ProductBySubCategoryView,
+    ProductListView, ProductDetailView, ProductBySubCategoryView, ProductSuggestView,
     ProductImageView, ProductInquiryView, TopProductsView, NewArrivalsView,
     list_products_view, add_product_view, edit_product_view, duplicate_product_view, delete_product_image_view, delete_package_image_view, delete_usage_media_view, delete_usage_media_image_view,
     list_specs_templates_view, add_specs_template_view, edit_specs_template_view, delete_specs_template_view,
@@ -35,6 +35,7 @@ urlpatterns = [
     path('admin/translate-fields/', translate_product_fields_view, name='translate_product_fields'),
 
     path('', ProductListView.as_view(), name='product-list'),
+    path('suggest/', ProductSuggestView.as_view(), name='product-suggest'),
     path('images/', ProductImageView.as_view(), name='product-images'),
     path('top-products/', TopProductsView.as_view(), name='top-products'),
     path('new-arrivals/', NewArrivalsView.as_view(), name='new-arrivals'),
@@ -1,7 +1,5 @@
 import uuid
 import json
-import asyncio
-import inspect
 
 from django.db.models import Q
 from rest_framework import generics
@@ -10,15 +8,16 @@ from rest_framework.views import APIView
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import permissions
-from .models import (Product, ProductImage, ProductLongDesc, 
+from .models import (Product, ProductImage, ProductLongDesc, ProductListing,
                      ProductPackageContentImages,
                      ProductSpecs, ProductSpecsTemplate, 
                      TopProduct, NewArrivals, ProductUsageItem, ProductUsageMediaImage
                      )
 from .utils import send_product_inquiry_telegram
 from apps.company.models import Connection
-from .serializers import (ProductSerializer, ProductImageSerializer, 
-                         TopProductListSerializer, NewArrivalsListSerializer)
+from .serializers import (ProductSerializer, ProductImageSerializer, ProductCardSerializer,
+                         TopProductListSerializer, NewArrivalsListSerializer,
+                         TopProductCardSerializer, NewArrivalsCardSerializer)
 from django.contrib.admin.views.decorators import staff_member_required
 from django.core.paginator import Paginator
 from django.shortcuts import render
@@ -27,44 +26,93 @@ from django.utils import translation
 from django.contrib import messages
 from django.shortcuts import redirect
 from django.utils.text import slugify
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.conf import settings
-from googletrans import Translator
 
 from apps.categories.models import SubCategory
 from apps.categories.models import Category
 from apps.company.utils import get_unique_code
+from apps.shared.fieldsets import has_fieldset_params
+from apps.shared.pagination import CreatedAtCursorPagination, SearchRankCursorPagination
+from apps.shared.projection import projection_language, translations_prefetch
+from apps.shared.response_cache import cache_response, collect_tags, object_tag
+from apps.shared.slugs import SlugLookupMixin, resolve_slug
+from .listing import ProductListingCursorPagination, get_listing_language
+from .documents import (get_base_url, get_product_document, product_detail_queryset, product_prefetches,
+                        store_product_document)
+from .search import search_products
+from .suggest import SUGGEST_DEFAULT_LIMIT, suggest
+from apps.shared.translation import translate_many
+
+
+class ProductCardViewMixin:
+    """
+    `?view=card` returns card data (name, slug, sku, subcategory, category, thumbnail)
+    read from the flat `product_listing` table instead of the full product payload.
+    """
+    card_serializer_class = ProductCardSerializer
 
+    def is_card_view(self):
+        return self.request.query_params.get('view') == 'card'
 
-translator = Translator()
+    def get_serializer_class(self):
+        if self.is_card_view():
+            return self.card_serializer_class
+        return super().get_serializer_class()
 
+    def get_listing_queryset(self):
+        lang = get_listing_language(self.request.query_params.get('lang', 'uz'))
+        return ProductListing.objects.filter(language_code=lang)
 
-def _translate_text_value(text, src_lang, dest_lang):
-    """Translate text safely for googletrans versions that may return awaitables."""
-    text = (text or '').strip()
-    if not text:
-        return ''
 
-    try:
-        result = translator.translate(text, src=src_lang, dest=dest_lang)
-        if inspect.isawaitable(result):
-            return asyncio.run(result).text
-        return result.text
-    except Exception:
-        return text
+def selected_product_fields(request):
+    """ProductSerializer fields selected by `?fields=` / `?expand=`, or None for all of them."""
+    if not has_fieldset_params(request):
+        return None
+    return ProductSerializer.selected_field_names(request)
+
+
+class ProductPrefetchMixin:
+    """
+    Prefetch what ProductSerializer reads for full (non-card) product lists;
+    only the requested language's translations with `?translations=current`
+    and only the requested relations with `?fields=` / `?expand=`.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.is_card_view():
+            return queryset
+        return queryset.select_related('subcategory').prefetch_related(
+            *product_prefetches(projection_language(self.request), selected_product_fields(self.request))
+        )
 
 
-class ProductListView(generics.ListAPIView):
+@cache_response(Product, SubCategory)
+class ProductListView(ProductPrefetchMixin, ProductCardViewMixin, generics.ListAPIView):
     """
     List products filtered by subcategory.
     
     Supports:
     - query param `subcategory_slug` + `lang` (recommended)
     - query param `subcategory` (numeric id)
-    - query param `search` (search in product name, description, SKU)
+    - query param `search` (full-text + substring search in product name, description, SKU; ranked by relevance)
+    - query param `view=card` (card data only; ignored together with `search`)
+    - cursor pagination (`cursor`, `page_size`), next/prev links in the `Link` header
     """
     serializer_class = ProductSerializer
 
+    @property
+    def pagination_class(self):
+        if self.request.query_params.get('search', '').strip():
+            return SearchRankCursorPagination
+        if self.is_card_view():
+            return ProductListingCursorPagination
+        return CreatedAtCursorPagination
+
+    def is_card_view(self):
+        return super().is_card_view() and not self.request.query_params.get('search', '').strip()
+
     def get_queryset(self):
         queryset = Product.objects.all()
         lang = self.request.query_params.get('lang', 'uz')
@@ -72,24 +120,24 @@ class ProductListView(generics.ListAPIView):
         # Search functionality
         search_query = self.request.query_params.get('search', '').strip()
         if search_query:
-            queryset = queryset.language(lang).filter(
-                Q(translations__name__icontains=search_query) |
-                Q(translations__description__icontains=search_query) |
-                Q(sku__icontains=search_query)
-            ).distinct()
-            return queryset
+            return search_products(queryset.language(lang), search_query, lang)
         
         # Filter by subcategory
         subcategory_id = self.request.query_params.get('subcategory')
         subcategory_slug = self.request.query_params.get('subcategory_slug')
 
+        if self.is_card_view():
+            queryset = self.get_listing_queryset()
+            if subcategory_slug:
+                return queryset.filter(subcategory_slug=subcategory_slug)
+            if subcategory_id:
+                return queryset.filter(subcategory_id=subcategory_id)
+            return queryset
+
         if subcategory_slug:
-            subcat = SubCategory.objects.language(lang).filter(
-                translations__slug=subcategory_slug,
-                translations__language_code=lang
-            ).first()
-            if subcat:
-                queryset = queryset.filter(subcategory_id=subcat.id)
+            subcat_id = resolve_slug(SubCategory, subcategory_slug)
+            if subcat_id:
+                queryset = queryset.filter(subcategory_id=subcat_id)
             else:
                 queryset = queryset.none()
         elif subcategory_id:
@@ -98,7 +146,8 @@ class ProductListView(generics.ListAPIView):
         return queryset.language(lang)
 
 
-class ProductDetailView(generics.RetrieveAPIView):
+@cache_response(Product, SubCategory)
+class ProductDetailView(SlugLookupMixin, generics.RetrieveAPIView):
     """Get product details by slug"""
     serializer_class = ProductSerializer
     lookup_field = 'slug'
@@ -106,26 +155,41 @@ class ProductDetailView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         lang = self.request.query_params.get("lang", "uz")
-        
-        return (
-            Product.objects.language(lang)
-            .prefetch_related("specs", "images", "package_content_images", "long_desc", "usage_media", "usage_media__images")
-            .select_related("subcategory")
+        return product_detail_queryset(
+            lang, projection_language(self.request), selected_product_fields(self.request),
         )
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        lang = self.request.query_params.get("lang", "uz")
-        product = self.get_object()
-        context['related_products'] = (
-            Product.objects.language(lang)
-            .filter(subcategory=product.subcategory)
-            .exclude(id=product.id)[:5]
+    def get_object(self):
+        # Resolve the product (and its prefetches) once per request.
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
+
+    def retrieve(self, request, *args, **kwargs):
+        lang = request.query_params.get("lang", "uz")
+        base_url = get_base_url(request)
+        # Serve the pre-rendered document when the client wants JSON; the browsable API,
+        # language-projected and sparse (`?fields=` / `?expand=`) responses render live.
+        use_document = (
+            request.accepted_renderer.format == 'json' and lang in dict(settings.LANGUAGES)
+            and projection_language(request) is None and not has_fieldset_params(request)
         )
-        return context
-
-
-class ProductBySubCategoryView(generics.ListAPIView):
+        if use_document:
+            document = get_product_document(self.get_object_pk(), lang, base_url)
+            if document is not None:
+                body, subcategory_id = document
+                # No instances are loaded here, so tag the cached response with what the body embeds.
+                collect_tags(object_tag(Product, self.get_object_pk()), object_tag(SubCategory, subcategory_id))
+                return HttpResponse(body, content_type='application/json')
+
+        response = super().retrieve(request, *args, **kwargs)
+        if use_document:
+            store_product_document(self.get_object(), lang, base_url, response.data)
+        return response
+
+
+@cache_response(Product, SubCategory)
+class ProductBySubCategoryView(ProductPrefetchMixin, ProductCardViewMixin, generics.ListAPIView):
     """
     List products for a given subcategory.
 
@@ -133,29 +197,37 @@ class ProductBySubCategoryView(generics.ListAPIView):
     - URL path lookup by translated slug (when mounted at /subcategories/<slug:slug>/products/)
     - query param `subcategory_slug` + `lang`
     - query param `subcategory` (numeric id) as fallback
+    - query param `view=card` (card data only)
+    - cursor pagination (`cursor`, `page_size`), next/prev links in the `Link` header
     """
     serializer_class = ProductSerializer
 
+    @property
+    def pagination_class(self):
+        if self.is_card_view():
+            return ProductListingCursorPagination
+        return CreatedAtCursorPagination
+
     def get_queryset(self):
         lang = self.request.query_params.get('lang', 'uz')
         # translation.activate(lang)
         # Prefer URL kwarg 'slug' when available
         slug = self.kwargs.get('slug')
+
+        if self.is_card_view():
+            queryset = self.get_listing_queryset()
+            subcat_slug = slug or self.request.query_params.get('subcategory_slug')
+            subcat_id = self.request.query_params.get('subcategory')
+            if subcat_slug:
+                return queryset.filter(subcategory_slug=subcat_slug)
+            if subcat_id:
+                return queryset.filter(subcategory_id=subcat_id)
+            return queryset
         
         if slug:
-            # translation.activate(lang)
-            # translation.set_current_language(lang)
-            subcat = SubCategory.objects.language(lang).filter(
-                slug=slug,
-                # language_code=lang
-                # translations__language_code=lang
-            ).first()
-            # subcat = SubCategory.objects.language(lang).filter(
-            #     translations__slug=slug,
-            #     translations__language_code=lang
-            # ).first()
-            if subcat:
-                products = Product.objects.language(lang).filter(subcategory_id=subcat.id)
+            subcat_id = resolve_slug(SubCategory, slug)
+            if subcat_id:
+                products = Product.objects.language(lang).filter(subcategory_id=subcat_id)
                 return products
             return Product.objects.none()
 
@@ -164,13 +236,9 @@ class ProductBySubCategoryView(generics.ListAPIView):
         subcat_id = self.request.query_params.get('subcategory')
 
         if subcat_slug:
-            subcat = SubCategory.objects.language(lang).filter(
-                slug=subcat_slug,
-                # language_code=lang
-                # translations__language_code=lang
-            ).first()
-            if subcat:
-                products = Product.objects.language(lang).filter(subcategory_id=subcat.id)
+            subcat_id = resolve_slug(SubCategory, subcat_slug)
+            if subcat_id:
+                products = Product.objects.language(lang).filter(subcategory_id=subcat_id)
                 return products
             return Product.objects.none()
 
@@ -182,6 +250,29 @@ class ProductBySubCategoryView(generics.ListAPIView):
         return Product.objects.language(lang).all()
 
 
+class ProductSuggestView(APIView):
+    """
+    Typeahead suggestions for the search box.
+
+    Supports:
+    - query param `q` (prefix of a category, subcategory or product name, or of any word in it)
+    - query param `lang` (default `uz`)
+    - query param `limit` (default 8, max 20)
+
+    Returns `[{"type": "category|subcategory|product", "name": ..., "slug": ...}]`.
+    """
+
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        lang = request.query_params.get('lang', 'uz')
+        try:
+            limit = int(request.query_params.get('limit', SUGGEST_DEFAULT_LIMIT))
+        except ValueError:
+            limit = SUGGEST_DEFAULT_LIMIT
+        return Response(suggest(query, lang, limit))
+
+
+@cache_response(ProductImage)
 class ProductImageView(APIView):
     """Get images for a specific product"""
     def get(self, request):
@@ -191,24 +282,38 @@ class ProductImageView(APIView):
         return Response(serializer.data)
 
 
-class TopProductsView(generics.ListAPIView):
-    """List all top products ordered by ordering field"""
+@cache_response(TopProduct, Product)
+class TopProductsView(ProductCardViewMixin, generics.ListAPIView):
+    """List all top products ordered by ordering field (`view=card` for card data only)"""
     serializer_class = TopProductListSerializer
+    card_serializer_class = TopProductCardSerializer
 
     def get_queryset(self):
         lang = self.request.query_params.get('lang', 'uz')
+        if self.is_card_view():
+            return TopProduct.objects.all()
         # Get all TopProduct entries with their related products, ordered by ordering field
-        return TopProduct.objects.select_related('product').prefetch_related('product__images').all()
+        return TopProduct.objects.select_related('product').prefetch_related(
+            translations_prefetch('product__translations', Product, projection_language(self.request)),
+            'product__images',
+        )
 
 
-class NewArrivalsView(generics.ListAPIView):
-    """List all new arrival products ordered by ordering field"""
+@cache_response(NewArrivals, Product)
+class NewArrivalsView(ProductCardViewMixin, generics.ListAPIView):
+    """List all new arrival products ordered by ordering field (`view=card` for card data only)"""
     serializer_class = NewArrivalsListSerializer
+    card_serializer_class = NewArrivalsCardSerializer
 
     def get_queryset(self):
         lang = self.request.query_params.get('lang', 'uz')
+        if self.is_card_view():
+            return NewArrivals.objects.all()
         # Get all NewArrivals entries with their related products, ordered by ordering field
-        return NewArrivals.objects.select_related('product').prefetch_related('product__images').all()
+        return NewArrivals.objects.select_related('product').prefetch_related(
+            translations_prefetch('product__translations', Product, projection_language(self.request)),
+            'product__images',
+        )
 
 class ProductInquiryView(generics.CreateAPIView):
     """Handle product inquiry form submissions"""
@@ -1194,38 +1299,47 @@ def translate_product_fields_view(request):
         return JsonResponse({'success': False, 'message': 'No valid target languages supplied'}, status=400)
 
     translatable_fields = ['name', 'description', 'long_desc', 'usage']
+    field_texts = {
+        field_name: (fields.get(field_name) or '').strip()
+        for field_name in translatable_fields
+    }
+
+    spec_rows = []
+    if isinstance(specs, list):
+        for item in specs:
+            if not isinstance(item, dict):
+                continue
+            key_text = (item.get('key') or '').strip()
+            value_text = (item.get('value') or '').strip()
+            if not key_text and not value_text:
+                continue
+            spec_rows.append((key_text, value_text))
+
+    # Every unique string is translated once, concurrently, for all target languages.
+    texts = list(field_texts.values())
+    for key_text, value_text in spec_rows:
+        texts.extend((key_text, value_text))
+    translated = translate_many(texts, source_lang, filtered_targets)
+
     result = {
         'success': True,
         'translations': {},
     }
 
     for dest_lang in filtered_targets:
-        translated_fields = {}
-        for field_name in translatable_fields:
-            translated_fields[field_name] = _translate_text_value(
-                fields.get(field_name, ''),
-                source_lang,
-                dest_lang
-            )
-
-        translated_specs = []
-        if isinstance(specs, list):
-            for item in specs:
-                if not isinstance(item, dict):
-                    continue
-                key_text = (item.get('key') or '').strip()
-                value_text = (item.get('value') or '').strip()
-                if not key_text and not value_text:
-                    continue
-
-                translated_specs.append({
-                    'key': _translate_text_value(key_text, source_lang, dest_lang),
-                    'value': _translate_text_value(value_text, source_lang, dest_lang),
-                })
-
+        lang_translations = translated[dest_lang]
         result['translations'][dest_lang] = {
-            'fields': translated_fields,
-            'specs': translated_specs,
+            'fields': {
+                field_name: lang_translations.get(text, text)
+                for field_name, text in field_texts.items()
+            },
+            'specs': [
+                {
+                    'key': lang_translations.get(key_text, key_text),
+                    'value': lang_translations.get(value_text, value_text),
+                }
+                for key_text, value_text in spec_rows
+            ],
         }
 
     return JsonResponse(result)
\ No newline at end of file
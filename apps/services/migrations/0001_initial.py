@@ -0,0 +1,161 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:25
+
+import apps.shared.mixins
+import django.db.models.deletion
+import parler.fields
+import parler.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='City',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('name', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+            options={
+                'verbose_name': 'City',
+                'verbose_name_plural': 'Cities',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Contacts',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('phone_number', models.CharField(blank=True, max_length=50, null=True)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('lat', models.CharField(blank=True, max_length=50, null=True)),
+                ('long', models.CharField(blank=True, max_length=50, null=True)),
+                ('start_day', models.CharField(blank=True, choices=[('DUSHANBA', 'Dushanba'), ('SESHANBA', 'Seshanba'), ('CHORSHANBA', 'Chorshanba'), ('PAYSHANBA', 'Payshanba'), ('JUMA', 'Juma'), ('SHANBA', 'Shanba'), ('YAKSHANBA', 'Yakshanba')], max_length=20, null=True)),
+                ('end_day', models.CharField(blank=True, choices=[('DUSHANBA', 'Dushanba'), ('SESHANBA', 'Seshanba'), ('CHORSHANBA', 'Chorshanba'), ('PAYSHANBA', 'Payshanba'), ('JUMA', 'Juma'), ('SHANBA', 'Shanba'), ('YAKSHANBA', 'Yakshanba')], max_length=20, null=True)),
+                ('start_time', models.CharField(blank=True, choices=[('00:00', '00:00'), ('01:00', '01:00'), ('02:00', '02:00'), ('03:00', '03:00'), ('04:00', '04:00'), ('05:00', '05:00'), ('06:00', '06:00'), ('07:00', '07:00'), ('08:00', '08:00'), ('09:00', '09:00'), ('10:00', '10:00'), ('11:00', '11:00'), ('12:00', '12:00'), ('13:00', '13:00'), ('14:00', '14:00'), ('15:00', '15:00'), ('16:00', '16:00'), ('17:00', '17:00'), ('18:00', '18:00'), ('19:00', '19:00'), ('20:00', '20:00'), ('21:00', '21:00'), ('22:00', '22:00'), ('23:00', '23:00')], max_length=5, null=True)),
+                ('end_time', models.CharField(blank=True, choices=[('00:00', '00:00'), ('01:00', '01:00'), ('02:00', '02:00'), ('03:00', '03:00'), ('04:00', '04:00'), ('05:00', '05:00'), ('06:00', '06:00'), ('07:00', '07:00'), ('08:00', '08:00'), ('09:00', '09:00'), ('10:00', '10:00'), ('11:00', '11:00'), ('12:00', '12:00'), ('13:00', '13:00'), ('14:00', '14:00'), ('15:00', '15:00'), ('16:00', '16:00'), ('17:00', '17:00'), ('18:00', '18:00'), ('19:00', '19:00'), ('20:00', '20:00'), ('21:00', '21:00'), ('22:00', '22:00'), ('23:00', '23:00')], max_length=5, null=True)),
+            ],
+            options={
+                'verbose_name': 'Contact',
+                'verbose_name_plural': 'Contacts',
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ServiceCenterDescription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Service Center Description',
+                'verbose_name_plural': 'Service Center Descriptions',
+            },
+            bases=(apps.shared.mixins.TranslatableAutoFillMixin, parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='Store',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('phone', models.CharField(blank=True, max_length=50, null=True)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('map_url', models.URLField(blank=True, max_length=2000, null=True)),
+                ('lat', models.CharField(blank=True, max_length=50, null=True)),
+                ('long', models.CharField(blank=True, max_length=50, null=True)),
+            ],
+            options={
+                'verbose_name': 'Store',
+                'verbose_name_plural': 'Stores',
+                'ordering': ['id'],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ServiceLocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('address', models.CharField(max_length=255)),
+                ('phone', models.CharField(max_length=50)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('map_url', models.URLField(blank=True, max_length=2000, null=True)),
+                ('city', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='service_location', to='services.city')),
+                ('description', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='locations', to='services.servicecenterdescription')),
+            ],
+            options={
+                'verbose_name': 'Service Location',
+                'verbose_name_plural': 'Service Locations',
+                'ordering': ['city__name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ContactsTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('address', models.CharField(blank=True, max_length=255, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='services.contacts')),
+            ],
+            options={
+                'verbose_name': 'Contact Translation',
+                'db_table': 'services_contacts_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ServiceCenterDescriptionTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('title', models.CharField(blank=True, max_length=255, null=True)),
+                ('description', models.TextField()),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='services.servicecenterdescription')),
+            ],
+            options={
+                'verbose_name': 'Service Center Description Translation',
+                'db_table': 'services_servicecenterdescription_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='StoreTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_code', models.CharField(db_index=True, max_length=15, verbose_name='Language')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('address', models.CharField(blank=True, max_length=255, null=True)),
+                ('master', parler.fields.TranslationsForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='services.store')),
+            ],
+            options={
+                'verbose_name': 'Store Translation',
+                'db_table': 'services_store_translation',
+                'db_tablespace': '',
+                'managed': True,
+                'default_permissions': (),
+                'unique_together': {('language_code', 'master')},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+    ]
@@ -1,9 +1,11 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from apps.shared.response_cache import cache_response
 from .models import City, ServiceLocation, ServiceCenterDescription, Store, Contacts
 from .serializers import CitySerializer, ServiceLocationSerializer, ServiceCenterDescriptionSerializer, StoreSerializer, ContactsSerializer
 
 
+@cache_response(City)
 class CityListView(APIView):
     """List all cities"""
     def get(self, request):
@@ -12,6 +14,7 @@ class CityListView(APIView):
         return Response(serializer.data)
 
 
+@cache_response(ServiceLocation)
 class ServiceLocationListView(APIView):
     """List all service locations"""
     def get(self, request):
@@ -20,6 +23,7 @@ class ServiceLocationListView(APIView):
         return Response(serializer.data)
 
 
+@cache_response(ServiceCenterDescription)
 class ServiceCenterDescriptionListView(APIView):
     """List service center descriptions"""
     def get(self, request):
@@ -28,6 +32,7 @@ class ServiceCenterDescriptionListView(APIView):
         return Response(serializer.data)
 
 
+@cache_response(Store)
 class StoreListView(APIView):
     """List all stores"""
     def get(self, request):
@@ -36,6 +41,7 @@ class StoreListView(APIView):
         return Response(serializer.data)
 
 
+@cache_response(Contacts)
 class ContactsListView(APIView):
     """List all contacts"""
     def get(self, request):
@@ -1,3 +1,20 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import TranslationJob, TranslationMemory
+
+
+@admin.register(TranslationJob)
+class TranslationJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'model_label', 'object_id', 'field', 'source_lang', 'target_lang', 'status', 'attempts', 'available_at')
+    list_filter = ('status', 'model_label', 'target_lang')
+    search_fields = ('model_label', 'last_error')
+    readonly_fields = ('created_at', 'updated_at')
+    ordering = ('-updated_at',)
+
+
+@admin.register(TranslationMemory)
+class TranslationMemoryAdmin(admin.ModelAdmin):
+    list_display = ('id', 'source_lang', 'target_lang', 'source_text', 'translated_text', 'created_at')
+    list_filter = ('source_lang', 'target_lang')
+    search_fields = ('source_text', 'translated_text')
+    readonly_fields = ('source_hash', 'created_at')
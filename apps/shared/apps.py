@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class SharedConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.shared'
+
+    def ready(self):
+        import apps.shared.home  # noqa: F401  connects the homepage section invalidation
+        import apps.shared.response_cache  # noqa: F401  connects the response cache tag purging
+        import apps.shared.slugs  # noqa: F401  connects the slug map invalidation
+        return super().ready()
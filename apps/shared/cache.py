@@ -0,0 +1,162 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+# Stale entries are kept this long past their freshness so one worker can rebuild while others serve them.
+STALE_GRACE = 60 * 5
+LOCK_TIMEOUT = 30
+LOCK_WAIT = 5
+LOCK_POLL_INTERVAL = 0.05
+
+_UNSET = object()
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _version_key(name):
+    return f'cache_version:{name}'
+
+
+def _new_version():
+    # Millisecond clock, so a version key lost to eviction restarts above any value it had before.
+    return int(time.time() * 1000)
+
+
+def get_cache_version(name):
+    """Return the current version of the ``name`` namespace."""
+    key = _version_key(name)
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def get_cache_versions(names, create=True):
+    """``{name: version}`` for several namespaces with one cache round trip.
+
+    With ``create=False`` namespaces without a stored version are left out
+    instead of being started.
+    """
+    keys = {_version_key(name): name for name in names}
+    found = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in found.items()}
+    if create:
+        for name in set(names) - set(versions):
+            versions[name] = get_cache_version(name)
+    return versions
+
+
+def bump_cache_version(name):
+    """Invalidate every entry stored for ``name`` by :func:`get_or_compute`."""
+    key = _version_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _new_version(), timeout=None)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+def single_flight(key, compute, reload=None, stale=None):
+    """Run ``compute`` for ``key`` once across threads and processes.
+
+    Threads of this process asking for a key that is already being computed
+    wait for that result. Across processes a cache lock elects one worker;
+    the others return ``stale`` when there is one, otherwise poll ``reload``
+    until the value shows up, and compute it themselves only when the lock
+    holder gives up or ``LOCK_WAIT`` runs out. ``None`` means "no value".
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        if stale is not None:
+            return stale
+        if flight.done.wait(LOCK_TIMEOUT) and flight.value is not None:
+            return flight.value
+        return compute()
+
+    try:
+        flight.value = _compute_locked(key, compute, reload, stale)
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
+    return flight.value
+
+
+def _compute_locked(key, compute, reload, stale):
+    lock_key = f'lock:{key}'
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        try:
+            return compute()
+        finally:
+            cache.delete(lock_key)
+    if stale is not None:
+        return stale
+
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        value = reload() if reload else None
+        if value is not None:
+            return value
+        if not cache.has_key(lock_key):
+            value = reload() if reload else None
+            return value if value is not None else compute()
+    return compute()
+
+
+def get_or_compute(key, namespace, compute, timeout, entry=_UNSET, version=None):
+    """Cached value of ``compute()`` for the current version of ``namespace``.
+
+    See :func:`get_or_compute_entry`.
+    """
+    return get_or_compute_entry(key, namespace, compute, timeout, entry=entry, version=version)['value']
+
+
+def get_or_compute_entry(key, namespace, compute, timeout, entry=_UNSET, version=None):
+    """Cache entry holding ``compute()`` for the current version of ``namespace``.
+
+    Besides the ``value`` the entry holds the ``version`` it was built for and
+    ``built_at``, which responses derive their validators from.
+
+    The entry stores the namespace version and a freshness deadline, so after
+    :func:`bump_cache_version` or once ``timeout`` has passed the old value is
+    still there to serve while a single worker rebuilds it (see
+    :func:`single_flight`). Pass ``entry`` and ``version`` when they were
+    already fetched, e.g. with ``cache.get_many``.
+    """
+    if version is None:
+        version = get_cache_version(namespace)
+    if entry is _UNSET:
+        entry = cache.get(key)
+    if _is_fresh(entry, version):
+        return entry
+
+    def rebuild():
+        value = compute()
+        built_at = time.time()
+        rebuilt = {'version': version, 'fresh_until': built_at + timeout, 'built_at': built_at, 'value': value}
+        cache.set(key, rebuilt, timeout + STALE_GRACE)
+        return rebuilt
+
+    def reload():
+        current = cache.get(key)
+        return current if _is_fresh(current, version) else None
+
+    return single_flight(key, rebuild, reload, stale=entry)
+
+
+def _is_fresh(entry, version):
+    return entry is not None and entry['version'] == version and entry['fresh_until'] > time.time()
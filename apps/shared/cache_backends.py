@@ -0,0 +1,365 @@
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import RedisError
+
+from apps.company.middleware import get_logger
+
+from .circuit_breaker import CircuitBreaker
+
+logger = get_logger()
+
+_MISSING = object()
+_CLEAR_ALL = '*'
+_shared_states = {}
+_shared_states_lock = threading.Lock()
+
+
+class RedisUnavailable(Exception):
+    """Redis failed or the circuit breaker is open."""
+
+
+class LocalLRUCache:
+    """Bounded, TTL-aware, thread-safe LRU holding pickled values."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISSING
+            expires_at, payload = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+        return pickle.loads(payload)
+
+    def set(self, key, value, timeout):
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def add(self, key, value, timeout):
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] > time.monotonic():
+                return False
+            self._data[key] = (time.monotonic() + timeout, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return True
+
+    def incr(self, key, delta):
+        """Add ``delta`` to a live entry keeping its expiry; ``_MISSING`` when there is none."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= time.monotonic():
+                return _MISSING
+            expires_at, payload = item
+            value = pickle.loads(payload) + delta
+            self._data[key] = (expires_at, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        return value
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _SharedState:
+    """L1, breaker and invalidation listener shared by every thread of a process.
+
+    Django creates one cache backend instance per thread, so per-instance
+    state would give each thread its own L1.
+    """
+
+    def __init__(self, max_entries, failure_threshold, cooldown):
+        self.l1 = LocalLRUCache(max_entries)
+        self.breaker = CircuitBreaker(failure_threshold=failure_threshold, cooldown=cooldown)
+        self.token = uuid.uuid4().hex
+        self.listening = False
+        self.listener = None
+
+
+class TwoTierCache(RedisCache):
+    """RedisCache (L2) with an in-process LRU (L1) in front of it.
+
+    Writes go to Redis, update the local L1 and are published on an
+    invalidation channel; a listener thread in every process drops the keys
+    other processes changed. L1 is only read while that listener is
+    subscribed, and its entries live at most ``L1_TIMEOUT`` seconds, which
+    bounds staleness when a message is lost.
+
+    Redis calls go through a :class:`CircuitBreaker`. While Redis fails or the
+    circuit is open reads are served from L1 or miss (the caller falls back to
+    the database) and writes, ``add`` and ``incr`` work on L1 only, so
+    namespace versions stay stable within the process during an outage.
+    ``incr`` of a key L1 does not hold raises ``ValueError`` like for a
+    missing key.
+
+    Extra ``OPTIONS``: ``L1_MAX_ENTRIES``, ``L1_TIMEOUT``, ``FAILURE_THRESHOLD``,
+    ``COOLDOWN``; the rest is passed to the Redis connection pool.
+    """
+
+    def __init__(self, server, params):
+        options = dict(params.get('OPTIONS', {}))
+        self._l1_max_entries = options.pop('L1_MAX_ENTRIES', 1000)
+        self._l1_timeout = options.pop('L1_TIMEOUT', 60)
+        self._failure_threshold = options.pop('FAILURE_THRESHOLD', 3)
+        self._cooldown = options.pop('COOLDOWN', 30)
+        super().__init__(server, {**params, 'OPTIONS': options})
+        self._channel = f'{self.key_prefix}:cache-invalidation' if self.key_prefix else 'cache-invalidation'
+
+    # Shared state and invalidation listener
+
+    @property
+    def _state(self):
+        state_key = (os.getpid(), tuple(self._servers), self.key_prefix)
+        state = _shared_states.get(state_key)
+        if state is None:
+            with _shared_states_lock:
+                state = _shared_states.get(state_key)
+                if state is None:
+                    state = _shared_states[state_key] = _SharedState(
+                        self._l1_max_entries, self._failure_threshold, self._cooldown,
+                    )
+        if state.listener is None:
+            with _shared_states_lock:
+                if state.listener is None:
+                    state.listener = threading.Thread(
+                        target=self._listen, args=(state,), name='cache-invalidation', daemon=True,
+                    )
+                    state.listener.start()
+        return state
+
+    def _listen(self, state):
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._cache.get_client(write=True).pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                # Invalidations sent while we were not subscribed are lost; start from an empty L1.
+                state.l1.clear()
+                state.listening = True
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._apply_invalidation(state, message['data'])
+            except (RedisError, OSError) as e:
+                if state.listening:
+                    logger.warning(f"⚠️ Cache invalidation listener disconnected: {e}")
+                state.listening = False
+                time.sleep(self._cooldown if state.breaker.is_open else 1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except (RedisError, OSError):
+                        pass
+
+    def _apply_invalidation(self, state, data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        token, _, keys = data.partition('\n')
+        if token == state.token:
+            return
+        if keys == _CLEAR_ALL:
+            state.l1.clear()
+        else:
+            state.l1.delete(*keys.split('\n'))
+
+    def _publish(self, keys):
+        try:
+            self._call_l2(
+                lambda: self._cache.get_client(write=True).publish(
+                    self._channel, '\n'.join([self._state.token, *keys]),
+                )
+            )
+        except RedisUnavailable:
+            pass
+
+    # L2 access
+
+    def _call_l2(self, operation):
+        breaker = self._state.breaker
+        if not breaker.allow():
+            raise RedisUnavailable
+        try:
+            result = operation()
+        except (RedisError, OSError) as e:
+            breaker.record_failure()
+            logger.warning(f"⚠️ Redis cache unavailable, serving from the local cache: {e}")
+            raise RedisUnavailable from e
+        breaker.record_success()
+        return result
+
+    def _l1_timeout_for(self, timeout):
+        backend_timeout = self.get_backend_timeout(timeout)
+        return self._l1_timeout if backend_timeout is None else min(backend_timeout, self._l1_timeout)
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        state = self._state
+        full_key = self.make_and_validate_key(key, version=version)
+        if state.listening:
+            value = state.l1.get(full_key)
+            if value is not _MISSING:
+                return value
+        try:
+            value = self._call_l2(lambda: super(TwoTierCache, self).get(key, _MISSING, version))
+        except RedisUnavailable:
+            value = state.l1.get(full_key)
+            return default if value is _MISSING else value
+        if value is _MISSING:
+            return default
+        state.l1.set(full_key, value, self._l1_timeout)
+        return value
+
+    def get_many(self, keys, version=None):
+        state = self._state
+        found = {}
+        missing = []
+        for key in keys:
+            value = state.l1.get(self.make_and_validate_key(key, version=version)) if state.listening else _MISSING
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        if not missing:
+            return found
+        try:
+            fetched = self._call_l2(lambda: super(TwoTierCache, self).get_many(missing, version))
+        except RedisUnavailable:
+            for key in missing:
+                value = state.l1.get(self.make_and_validate_key(key, version=version))
+                if value is not _MISSING:
+                    found[key] = value
+            return found
+        for key, value in fetched.items():
+            state.l1.set(self.make_and_validate_key(key, version=version), value, self._l1_timeout)
+        found.update(fetched)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        try:
+            self._call_l2(lambda: super(TwoTierCache, self).set(key, value, timeout, version))
+        except RedisUnavailable:
+            pass
+        self._set_local(full_key, value, timeout)
+        self._publish([full_key])
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        if not data:
+            return []
+        try:
+            self._call_l2(lambda: super(TwoTierCache, self).set_many(data, timeout, version))
+        except RedisUnavailable:
+            pass
+        full_keys = []
+        for key, value in data.items():
+            full_key = self.make_and_validate_key(key, version=version)
+            self._set_local(full_key, value, timeout)
+            full_keys.append(full_key)
+        self._publish(full_keys)
+        return []
+
+    def _set_local(self, full_key, value, timeout):
+        l1_timeout = self._l1_timeout_for(timeout)
+        if l1_timeout > 0:
+            self._state.l1.set(full_key, value, l1_timeout)
+        else:
+            self._state.l1.delete(full_key)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        try:
+            added = self._call_l2(lambda: super(TwoTierCache, self).add(key, value, timeout, version))
+        except RedisUnavailable:
+            l1_timeout = self._l1_timeout_for(timeout)
+            return l1_timeout > 0 and self._state.l1.add(full_key, value, l1_timeout)
+        if added:
+            self._set_local(full_key, value, timeout)
+            self._publish([full_key])
+        return added
+
+    def incr(self, key, delta=1, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        try:
+            value = self._call_l2(lambda: super(TwoTierCache, self).incr(key, delta, version))
+        except RedisUnavailable:
+            value = self._state.l1.incr(full_key, delta)
+            if value is _MISSING:
+                raise ValueError(f"Key '{key}' not found.") from None
+            return value
+        except ValueError:
+            self._state.l1.delete(full_key)
+            raise
+        self._state.l1.delete(full_key)
+        self._publish([full_key])
+        return value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        self._state.l1.delete(full_key)
+        try:
+            return self._call_l2(lambda: super(TwoTierCache, self).touch(key, timeout, version))
+        except RedisUnavailable:
+            return False
+
+    def has_key(self, key, version=None):
+        try:
+            return self._call_l2(lambda: super(TwoTierCache, self).has_key(key, version))
+        except RedisUnavailable:
+            return self._state.l1.get(self.make_and_validate_key(key, version=version)) is not _MISSING
+
+    def delete(self, key, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        self._state.l1.delete(full_key)
+        try:
+            deleted = self._call_l2(lambda: super(TwoTierCache, self).delete(key, version))
+        except RedisUnavailable:
+            return False
+        self._publish([full_key])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        if not keys:
+            return
+        full_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        self._state.l1.delete(*full_keys)
+        try:
+            self._call_l2(lambda: super(TwoTierCache, self).delete_many(keys, version))
+        except RedisUnavailable:
+            return
+        self._publish(full_keys)
+
+    def clear(self):
+        self._state.l1.clear()
+        try:
+            cleared = self._call_l2(lambda: super(TwoTierCache, self).clear())
+        except RedisUnavailable:
+            return False
+        self._publish([_CLEAR_ALL])
+        return cleared
@@ -0,0 +1,38 @@
+import time
+from threading import Lock
+
+
+class CircuitBreaker:
+    """Per-process circuit breaker for flaky external services.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    :meth:`allow` returns False for ``cooldown`` seconds. Once the cooldown
+    has passed calls are let through again; the next success closes the
+    circuit, the next failure reopens it for another cooldown.
+    """
+
+    def __init__(self, failure_threshold=5, cooldown=60):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._lock = Lock()
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.cooldown
+
+    def allow(self):
+        return not self.is_open
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
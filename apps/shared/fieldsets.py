@@ -0,0 +1,81 @@
+from rest_framework import serializers
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+NESTED_CONTEXT = 'fieldsets_nested'
+
+
+def _param_set(request, name):
+    if request is None:
+        return None
+    value = request.GET.get(name, '')
+    names = {part.strip() for part in value.split(',') if part.strip()}
+    return names or None
+
+
+def has_fieldset_params(request):
+    return _param_set(request, FIELDS_PARAM) is not None or _param_set(request, EXPAND_PARAM) is not None
+
+
+def selected_fields(request, field_names, expandable=(), on_demand=()):
+    """The names out of ``field_names`` to render for ``request``.
+
+    ``?fields=a,b`` renders exactly those fields. Otherwise every field except
+    the ``on_demand`` ones is rendered, and once ``?expand=`` is given the
+    ``expandable`` relations only when they are listed in it. Without either
+    parameter the full payload is kept.
+    """
+    fields = _param_set(request, FIELDS_PARAM)
+    if fields is not None:
+        return [name for name in field_names if name in fields]
+    expand = _param_set(request, EXPAND_PARAM)
+    return [
+        name for name in field_names
+        if name not in on_demand and (expand is None or name not in expandable or name in expand)
+    ]
+
+
+def nested_context(context):
+    """Context for a serializer built inside another one's method, so it is not taken for the top level."""
+    return {**context, NESTED_CONTEXT: True}
+
+
+def is_field_requested(request, name):
+    """Whether a field outside the serializer's declared ones (e.g. a projected translation) is wanted."""
+    fields = _param_set(request, FIELDS_PARAM)
+    return fields is None or name in fields
+
+
+class SparseFieldsetMixin:
+    """``?fields=`` and ``?expand=`` support for the top-level serializer of a response.
+
+    ``Meta.expandable_fields`` lists the costly relations ``?expand=`` switches
+    on, ``Meta.on_demand_fields`` the fields only rendered when named in
+    ``?fields=``. Nested serializers always render in full; ones built by
+    hand inside another serializer get :func:`nested_context`.
+    """
+
+    @classmethod
+    def selected_field_names(cls, request):
+        meta = cls.Meta
+        return selected_fields(
+            request, list(meta.fields),
+            getattr(meta, 'expandable_fields', ()), getattr(meta, 'on_demand_fields', ()),
+        )
+
+    def is_top_level(self):
+        if self.context.get(NESTED_CONTEXT):
+            return False
+        parent = self.parent
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        meta = self.Meta
+        on_demand = getattr(meta, 'on_demand_fields', ())
+        if not self.is_top_level():
+            return {name: field for name, field in fields.items() if name not in on_demand}
+        keep = set(selected_fields(
+            self.context.get('request'), list(fields), getattr(meta, 'expandable_fields', ()), on_demand,
+        ))
+        return {name: field for name, field in fields.items() if name in keep}
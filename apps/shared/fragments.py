@@ -0,0 +1,95 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from django.utils.translation import get_language
+from rest_framework import serializers
+
+FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def touch(model, pks):
+    """Move ``updated_at`` of ``pks`` forward so their cached fragments are no longer used."""
+    pks = [pk for pk in pks if pk is not None]
+    if pks:
+        model.objects.filter(pk__in=pks).update(updated_at=timezone.now())
+
+
+def touch_parent_on_change(child_model, field_name):
+    """Touch the row ``field_name`` points to whenever a ``child_model`` row is saved or deleted.
+
+    For rows rendered inside their parent's fragment (translations, images).
+    """
+    field = child_model._meta.get_field(field_name)
+
+    def receiver(sender, instance, **kwargs):
+        touch(field.related_model, [getattr(instance, field.attname)])
+
+    uid = f'fragment_touch_{child_model._meta.label_lower}'
+    post_save.connect(receiver, sender=child_model, weak=False, dispatch_uid=f'{uid}_save')
+    post_delete.connect(receiver, sender=child_model, weak=False, dispatch_uid=f'{uid}_delete')
+
+
+class FragmentListSerializer(serializers.ListSerializer):
+    """Reads the fragments of a whole list with one ``get_many``; only misses are serialized."""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        child = self.child
+        keys = [child.fragment_key(item) for item in items]
+        cached = cache.get_many([key for key in keys if key is not None])
+
+        result = []
+        missed = {}
+        for item, key in zip(items, keys):
+            fragment = cached.get(key) if key is not None else None
+            if fragment is None:
+                fragment = child.to_fragment(item)
+                if key is not None:
+                    missed[key] = fragment
+            result.append(fragment)
+        if missed:
+            cache.set_many(missed, FRAGMENT_CACHE_TIMEOUT)
+        return result
+
+
+class FragmentCacheMixin:
+    """Cache each object's representation under (serializer, pk, updated_at, request variant).
+
+    ``updated_at`` from BaseModel versions the fragment: any change to the
+    object, or to child rows connected with :func:`touch_parent_on_change`,
+    moves it and the old fragment is simply no longer read. Set
+    ``Meta.list_serializer_class = FragmentListSerializer`` to batch lists.
+    """
+
+    def fragment_key(self, instance):
+        updated_at = getattr(instance, 'updated_at', None)
+        if instance.pk is None or updated_at is None:
+            return None
+        request = self.context.get('request')
+        variant = '|'.join([
+            get_language() or '',
+            request.GET.get('lang', '') if request is not None else '',
+            request.GET.get('translations', '') if request is not None else '',
+            request.GET.get('fields', '') if request is not None else '',
+            request.GET.get('expand', '') if request is not None else '',
+            request.build_absolute_uri('/') if request is not None else '',
+        ])
+        return 'fragment:{}:{}:{}:{}'.format(
+            type(self).__name__, instance.pk, updated_at.timestamp(),
+            hashlib.md5(variant.encode('utf-8')).hexdigest()[:12],
+        )
+
+    def to_fragment(self, instance):
+        return dict(super().to_representation(instance))
+
+    def to_representation(self, instance):
+        key = self.fragment_key(instance)
+        if key is None:
+            return self.to_fragment(instance)
+        fragment = cache.get(key)
+        if fragment is None:
+            fragment = self.to_fragment(instance)
+            cache.set(key, fragment, FRAGMENT_CACHE_TIMEOUT)
+        return fragment
@@ -0,0 +1,123 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from apps.categories.tree import get_category_tree_entry
+from apps.company.models import Banner, BannerImages, Company, Partners
+from apps.company.serializers import BannerSerializer, CompanySerializer, PartnersSerializer
+from apps.products.documents import get_base_url
+from apps.products.models import NewArrivals, Product, ProductImage, TopProduct
+from apps.products.serializers import NewArrivalsListSerializer, TopProductListSerializer
+from apps.shared.cache import bump_cache_version, get_cache_versions, get_or_compute_entry
+from apps.shared.projection import projection_language, translations_prefetch
+from apps.shared.signals import translations_bulk_created
+
+HOME_CACHE_TIMEOUT = 60 * 60 * 24
+FALLBACK_LANGUAGE = 'uz'
+
+
+def _banners(request, language_code):
+    banners = (
+        Banner.objects.filter(is_active=True).language(language_code)
+        .prefetch_related('translations', 'additional_images')
+    )
+    return BannerSerializer(banners, many=True, context={'request': request}).data
+
+
+def _top_products(request, language_code):
+    entries = TopProduct.objects.select_related('product').prefetch_related(
+        translations_prefetch('product__translations', Product, projection_language(request)), 'product__images',
+    )
+    return TopProductListSerializer(entries, many=True, context={'request': request}).data
+
+
+def _new_arrivals(request, language_code):
+    entries = NewArrivals.objects.select_related('product').prefetch_related(
+        translations_prefetch('product__translations', Product, projection_language(request)), 'product__images',
+    )
+    return NewArrivalsListSerializer(entries, many=True, context={'request': request}).data
+
+
+def _partners(request, language_code):
+    partners = Partners.objects.order_by('id')
+    return PartnersSerializer(partners, many=True, context={'request': request}).data
+
+
+def _company(request, language_code):
+    companies = Company.objects.language(language_code).prefetch_related('translations')
+    return CompanySerializer(companies, many=True, context={'request': request}).data
+
+
+# Cached homepage sections: builder and the models whose changes rebuild the section.
+HOME_SECTIONS = {
+    'banners': (_banners, (Banner, BannerImages)),
+    'top_products': (_top_products, (TopProduct, Product, ProductImage)),
+    'new_arrivals': (_new_arrivals, (NewArrivals, Product, ProductImage)),
+    'partners': (_partners, (Partners,)),
+    'company': (_company, (Company,)),
+}
+
+
+def _namespace(section):
+    return f'home_{section}'
+
+
+def invalidate_home_section(section):
+    bump_cache_version(_namespace(section))
+
+
+def get_home_page_entries(request, language_code):
+    """The cache entry of every homepage section, each section being its entry's ``value``.
+
+    The versions and fragments of all sections are fetched with one
+    ``get_many`` each; only stale sections are rebuilt, by one worker at a
+    time (see :func:`apps.shared.cache.get_or_compute_entry`). Categories come from
+    the category tree, which has its own cache. Sections rendered with
+    ``?translations=current`` are cached apart from the all-languages ones.
+    """
+    if language_code not in dict(settings.LANGUAGES):
+        language_code = FALLBACK_LANGUAGE
+    base_url = get_base_url(request)
+    projection = projection_language(request) or 'all'
+
+    versions = get_cache_versions([_namespace(section) for section in HOME_SECTIONS])
+    keys = {
+        section: f'{_namespace(section)}:{language_code}:{projection}:{base_url}' for section in HOME_SECTIONS
+    }
+    fragments = cache.get_many(keys.values())
+
+    entries = {}
+    for section, (build, _models) in HOME_SECTIONS.items():
+        entries[section] = get_or_compute_entry(
+            keys[section],
+            _namespace(section),
+            lambda build=build: build(request, language_code),
+            HOME_CACHE_TIMEOUT,
+            entry=fragments.get(keys[section]),
+            version=versions[_namespace(section)],
+        )
+    entries['categories'] = get_category_tree_entry(language_code, base_url)
+    return entries
+
+
+def _section_invalidator(section):
+    def invalidate(sender, **kwargs):
+        transaction.on_commit(lambda: invalidate_home_section(section))
+    return invalidate
+
+
+# Receivers are connected weakly; keep the closures alive here.
+_invalidators = {}
+for _section, (_build, _models) in HOME_SECTIONS.items():
+    _invalidators[_section] = _invalidate = _section_invalidator(_section)
+    for _model in _models:
+        _senders = [_model]
+        if hasattr(_model, '_parler_meta'):
+            _senders.append(_model._parler_meta.root_model)
+            translations_bulk_created.connect(
+                _invalidate, sender=_model, dispatch_uid=f'home_{_section}_{_model._meta.label_lower}_bulk',
+            )
+        for _sender in _senders:
+            post_save.connect(_invalidate, sender=_sender, dispatch_uid=f'home_{_section}_{_sender._meta.label_lower}_save')
+            post_delete.connect(_invalidate, sender=_sender, dispatch_uid=f'home_{_section}_{_sender._meta.label_lower}_delete')
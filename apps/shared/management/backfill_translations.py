@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Q
+
+from apps.shared.mixins import TranslatableAutoFillMixin
+from apps.shared.signals import translations_bulk_created
+from apps.shared.translation import TRANSLATION_CONCURRENCY, forget_cached_translations, translate_many
+
+
+@dataclass
+class Stats:
+    objects: int = 0
+    written: int = 0
+    failed: int = 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Create every missing translation row of the auto-translated models "
+        "(Product, Category, SubCategory, Company, New, ServiceCenterDescription) in bulk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the missing translations without translating or writing anything.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Only backfill this model (e.g. products.product or Product). Can be repeated.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=TRANSLATION_CONCURRENCY,
+            help="Maximum number of simultaneous translation requests.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of objects translated and inserted per batch.",
+        )
+
+    def handle(self, *args, **options):
+        stats = Stats()
+        languages = [code for code, _name in settings.LANGUAGES]
+
+        for model in self._get_models(options["models"]):
+            gaps = self._find_gaps(model, languages)
+            label = model._meta.label_lower
+            missing_count = sum(len(missing) for _source_lang, missing in gaps.values())
+            self.stdout.write(
+                self.style.NOTICE(f"{label}: {len(gaps)} objects, {missing_count} missing translations")
+            )
+
+            if options["dry_run"]:
+                for master_id, (source_lang, missing) in gaps.items():
+                    self.stdout.write(
+                        f"[DRY-RUN] Would translate {label}#{master_id} {source_lang} -> {', '.join(missing)}"
+                    )
+                continue
+
+            master_ids = list(gaps)
+            for start in range(0, len(master_ids), options["batch_size"]):
+                batch = {master_id: gaps[master_id] for master_id in master_ids[start:start + options["batch_size"]]}
+                self._backfill_batch(model, batch, options["concurrency"], stats)
+                stats.objects += len(batch)
+                self.stdout.write(f"  {label}: {min(start + options['batch_size'], len(master_ids))}/{len(master_ids)}")
+
+        summary_style = self.style.WARNING if stats.failed else self.style.SUCCESS
+        self.stdout.write(
+            summary_style(
+                "Done. objects={objects}, written={written}, failed={failed}".format(
+                    objects=stats.objects,
+                    written=stats.written,
+                    failed=stats.failed,
+                )
+            )
+        )
+
+    @staticmethod
+    def _get_models(requested):
+        models = [model for model in apps.get_models() if issubclass(model, TranslatableAutoFillMixin)]
+        if not requested:
+            return models
+
+        selected = []
+        for name in requested:
+            name = name.lower()
+            matches = [m for m in models if name in (m._meta.label_lower, m._meta.model_name)]
+            if not matches:
+                raise CommandError(
+                    f"Unknown model '{name}'. Choose from: {', '.join(m._meta.label_lower for m in models)}"
+                )
+            selected.extend(matches)
+        return selected
+
+    @staticmethod
+    def _find_gaps(model, languages):
+        """Return ``{master_id: (source_lang, [missing languages])}`` using one grouped query."""
+        translation_model = model._parler_meta.root_model
+        annotations = {f"has_{code}": Count("pk", filter=Q(language_code=code)) for code in languages}
+        incomplete = Q()
+        for code in languages:
+            incomplete |= Q(**{f"has_{code}": 0})
+
+        rows = (
+            translation_model.objects.values("master_id")
+            .annotate(**annotations)
+            .filter(incomplete)
+            .order_by("master_id")
+        )
+
+        gaps = {}
+        for row in rows:
+            present = [code for code in languages if row[f"has_{code}"]]
+            if model.auto_translate_source_language in present:
+                source_lang = model.auto_translate_source_language
+            elif model.auto_translate_any_source and present:
+                source_lang = present[0]
+            else:
+                continue
+            gaps[row["master_id"]] = (source_lang, [code for code in languages if code not in present])
+        return gaps
+
+    def _backfill_batch(self, model, batch, concurrency, stats):
+        translation_model = model._parler_meta.root_model
+        fields = model.auto_translate_fields
+        copy_fields = model.auto_translate_copy_fields
+
+        by_source = defaultdict(list)
+        for master_id, (source_lang, _missing) in batch.items():
+            by_source[source_lang].append(master_id)
+
+        rows = []
+        for source_lang, master_ids in by_source.items():
+            sources = list(translation_model.objects.filter(master_id__in=master_ids, language_code=source_lang))
+            target_langs = sorted({lang for master_id in master_ids for lang in batch[master_id][1]})
+
+            texts = [getattr(source, field) for source in sources for field in fields]
+            translated = translate_many(texts, source_lang, target_langs, concurrency=concurrency)
+
+            for source in sources:
+                for lang in batch[source.master_id][1]:
+                    values = {}
+                    for field in fields:
+                        text = (getattr(source, field) or "").strip()
+                        values[field] = translated[lang].get(text) if text else ""
+                    if any(value is None for value in values.values()):
+                        stats.failed += 1
+                        continue
+                    rows.append(translation_model(
+                        master_id=source.master_id,
+                        language_code=lang,
+                        **{field: getattr(source, field) for field in copy_fields},
+                        **values,
+                    ))
+
+        # Rows created meanwhile (e.g. by the worker) are left untouched.
+        translation_model.objects.bulk_create(rows, ignore_conflicts=True)
+        forget_cached_translations(translation_model, [(row.master_id, row.language_code) for row in rows])
+        translations_bulk_created.send(sender=model, master_ids=sorted({row.master_id for row in rows}))
+        stats.written += len(rows)
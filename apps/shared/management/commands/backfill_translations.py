@@ -0,0 +1 @@
+from apps.shared.management.backfill_translations import Command
@@ -0,0 +1 @@
+from apps.shared.management.run_translation_worker import Command
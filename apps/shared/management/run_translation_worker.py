@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.company.middleware import get_logger
+from apps.shared.models import TranslationJob
+from apps.shared.translation import get_memory_stats, translate_text
+
+logger = get_logger()
+
+# A job left in "running" longer than this is assumed to belong to a dead worker.
+STALE_RUNNING_AFTER = timedelta(minutes=10)
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+
+
+@dataclass
+class Stats:
+    processed: int = 0
+    translated: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Process queued auto-translation jobs in batches and write the results "
+        "back as parler translations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of jobs claimed per batch.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=5,
+            help="Give up on a job after this many failed attempts.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the queue is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently available jobs and exit instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        max_attempts = options["max_attempts"]
+        stats = Stats()
+
+        self.stdout.write(self.style.NOTICE("Translation worker started..."))
+
+        try:
+            while True:
+                jobs = self._claim_batch(batch_size)
+                if not jobs:
+                    if options["once"]:
+                        break
+                    time.sleep(options["sleep"])
+                    continue
+
+                self._process_batch(jobs, max_attempts, stats)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Interrupted."))
+
+        memory = get_memory_stats()
+        summary_style = self.style.WARNING if stats.failed else self.style.SUCCESS
+        self.stdout.write(
+            summary_style(
+                "Done. processed={processed}, translated={translated}, retried={retried}, failed={failed}, "
+                "memory_hit_rate={hit_rate:.1%}".format(
+                    processed=stats.processed,
+                    translated=stats.translated,
+                    retried=stats.retried,
+                    failed=stats.failed,
+                    hit_rate=memory['hit_rate'],
+                )
+            )
+        )
+
+    @staticmethod
+    def _claim_batch(batch_size: int) -> list[TranslationJob]:
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                TranslationJob.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=TranslationJob.STATUS_PENDING, available_at__lte=now)
+                    | Q(status=TranslationJob.STATUS_RUNNING, updated_at__lt=now - STALE_RUNNING_AFTER)
+                )
+                .order_by("available_at", "id")[:batch_size]
+            )
+            TranslationJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=TranslationJob.STATUS_RUNNING,
+                updated_at=now,
+            )
+        return jobs
+
+    def _process_batch(self, jobs: list[TranslationJob], max_attempts: int, stats: Stats) -> None:
+        # All fields of one object/language are written back as a single translation row.
+        groups = defaultdict(list)
+        for job in jobs:
+            groups[(job.model_label, job.object_id, job.source_lang, job.target_lang)].append(job)
+
+        for (model_label, object_id, source_lang, target_lang), group in groups.items():
+            stats.processed += len(group)
+            try:
+                self._apply(model_label, object_id, source_lang, target_lang, [job.field for job in group])
+            except Exception as exc:
+                self._reschedule(group, exc, max_attempts, stats)
+                continue
+
+            TranslationJob.objects.filter(pk__in=[job.pk for job in group]).update(
+                status=TranslationJob.STATUS_DONE,
+                last_error="",
+                updated_at=timezone.now(),
+            )
+            stats.translated += len(group)
+
+    def _apply(self, model_label: str, object_id: int, source_lang: str, target_lang: str, fields: list[str]) -> None:
+        model = apps.get_model(model_label)
+        instance = model.objects.filter(pk=object_id).first()
+        if instance is None:
+            # Object deleted since the job was queued; nothing left to translate.
+            return
+
+        source = instance.translations.filter(language_code=source_lang).first()
+        if source is None:
+            raise LookupError(f"No {source_lang} translation for {model_label}#{object_id}")
+
+        values = {field: translate_text(getattr(source, field), source_lang, target_lang) for field in fields}
+
+        existing = instance.translations.filter(language_code=target_lang).first()
+        if existing is None:
+            copied = {
+                field: getattr(source, field)
+                for field in getattr(model, 'auto_translate_copy_fields', ())
+            }
+            instance.create_translation(language_code=target_lang, **copied, **values)
+        else:
+            # Never overwrite text an editor has filled in meanwhile.
+            update_fields = [field for field, value in values.items() if not getattr(existing, field)]
+            for field in update_fields:
+                setattr(existing, field, values[field])
+            if update_fields:
+                existing.save(update_fields=update_fields)
+
+        self.stdout.write(self.style.SUCCESS(f"Translated {model_label}#{object_id} {source_lang}->{target_lang}"))
+        logger.info(f"✅ Translated {model_label}#{object_id} {source_lang}->{target_lang}: {', '.join(fields)}")
+
+    def _reschedule(self, group: list[TranslationJob], exc: Exception, max_attempts: int, stats: Stats) -> None:
+        attempts = group[0].attempts + 1
+        if attempts >= max_attempts:
+            status = TranslationJob.STATUS_FAILED
+            stats.failed += len(group)
+        else:
+            status = TranslationJob.STATUS_PENDING
+            stats.retried += len(group)
+
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+        now = timezone.now()
+        TranslationJob.objects.filter(pk__in=[job.pk for job in group]).update(
+            status=status,
+            attempts=attempts,
+            last_error=str(exc),
+            available_at=now + timedelta(seconds=delay),
+            updated_at=now,
+        )
+
+        job = group[0]
+        self.stdout.write(
+            self.style.ERROR(
+                f"Failed {job.model_label}#{job.object_id} {job.source_lang}->{job.target_lang} "
+                f"(attempt {attempts}/{max_attempts}): {exc}"
+            )
+        )
+        logger.error(f"❌ Translation failed for {job.model_label}#{job.object_id} {job.target_lang}: {exc}")
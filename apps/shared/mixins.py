@@ -0,0 +1,53 @@
+from django.conf import settings
+
+from apps.company.middleware import get_logger
+
+from .translation import auto_translate
+
+logger = get_logger()
+
+
+class TranslatableAutoFillMixin:
+    """Fill in missing parler translations after every save.
+
+    Subclasses list the translated fields to machine-translate in
+    ``auto_translate_fields`` and the ones to copy verbatim from the source
+    translation in ``auto_translate_copy_fields``. Existing translations are
+    loaded with a single query; languages already covered by translation
+    memory are written with one bulk insert and the rest are queued for
+    ``run_translation_worker``.
+    """
+    auto_translate_fields = ()
+    auto_translate_copy_fields = ()
+    auto_translate_source_language = 'uz'
+    # Translate from any existing language when the source language row is missing.
+    auto_translate_any_source = False
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.auto_fill_translations()
+
+    def prepare_source_translation(self, source):
+        """Hook to normalise the source translation row before it is translated."""
+
+    def auto_fill_translations(self):
+        """Create or queue the missing translations. Returns the queued language codes."""
+        translation_model = self._parler_meta.root_model
+        existing = {
+            translation.language_code: translation
+            for translation in translation_model.objects.filter(master_id=self.pk).order_by('pk')
+        }
+
+        source = existing.get(self.auto_translate_source_language)
+        if source is None and self.auto_translate_any_source and existing:
+            source = next(iter(existing.values()))
+        if source is None:
+            return []
+
+        self.prepare_source_translation(source)
+
+        missing_langs = [code for code, _name in settings.LANGUAGES if code not in existing]
+        queued_langs = auto_translate(self, source, self.auto_translate_fields, missing_langs)
+        if queued_langs:
+            logger.info(f"🕒 Queued translation of {self} (src: {source.language_code}): {', '.join(queued_langs)}")
+        return queued_langs
@@ -1,3 +1,73 @@
 from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
-# Create your models here.
+
+class TranslationJob(models.Model):
+    """A pending auto-translation of one translated field into one language.
+
+    Jobs are queued by the models' save() and processed in batches by the
+    ``run_translation_worker`` management command.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _('Pending')),
+        (STATUS_RUNNING, _('Running')),
+        (STATUS_DONE, _('Done')),
+        (STATUS_FAILED, _('Failed')),
+    )
+
+    model_label = models.CharField(max_length=100, help_text=_("e.g. products.product"))
+    object_id = models.PositiveBigIntegerField()
+    field = models.CharField(max_length=100)
+    source_lang = models.CharField(max_length=15)
+    target_lang = models.CharField(max_length=15)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Translation Job")
+        verbose_name_plural = _("Translation Jobs")
+        ordering = ['available_at', 'id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['model_label', 'object_id', 'field', 'target_lang'],
+                name='unique_translation_job',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='translation_job_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model_label}#{self.object_id}.{self.field} {self.source_lang}->{self.target_lang}"
+
+
+class TranslationMemory(models.Model):
+    """Previously produced translation of a source string, keyed by its sha1."""
+    source_hash = models.CharField(max_length=40)
+    source_lang = models.CharField(max_length=15)
+    target_lang = models.CharField(max_length=15)
+    source_text = models.TextField()
+    translated_text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Translation Memory")
+        verbose_name_plural = _("Translation Memory")
+        constraints = [
+            models.UniqueConstraint(
+                fields=['source_hash', 'source_lang', 'target_lang'],
+                name='unique_translation_memory',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.source_lang}->{self.target_lang}: {self.source_text[:50]}"
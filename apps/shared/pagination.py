@@ -0,0 +1,36 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Cursor (keyset) pagination over ``(created_at, id)``, newest first.
+
+    The response body stays a plain list so existing clients keep working;
+    the cursors for the neighbouring pages are sent in the ``Link`` header
+    (``<url>; rel="next"``). Clients pick the page size with ``?page_size=``,
+    capped at ``max_page_size``.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_paginated_response(self, data):
+        links = []
+        next_link = self.get_next_link()
+        if next_link:
+            links.append(f'<{next_link}>; rel="next"')
+        previous_link = self.get_previous_link()
+        if previous_link:
+            links.append(f'<{previous_link}>; rel="prev"')
+
+        headers = {'Link': ', '.join(links)} if links else None
+        return Response(data, headers=headers)
+
+    def get_paginated_response_schema(self, schema):
+        return schema
+
+
+class SearchRankCursorPagination(CreatedAtCursorPagination):
+    """Cursor pagination for relevance-ordered results annotated with ``search_rank``."""
+    ordering = ('-search_rank', '-id')
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.db.models import Prefetch
+
+from .fieldsets import is_field_requested
+
+PROJECTION_PARAM = 'translations'
+PROJECTION_CURRENT = 'current'
+FALLBACK_LANGUAGE = 'uz'
+
+
+def projection_language(request):
+    """Language to flatten translations to (``?translations=current``), or None for all languages."""
+    if request is None or request.GET.get(PROJECTION_PARAM) != PROJECTION_CURRENT:
+        return None
+    language_code = request.GET.get('lang', FALLBACK_LANGUAGE)
+    return language_code if language_code in dict(settings.LANGUAGES) else FALLBACK_LANGUAGE
+
+
+def translations_prefetch(lookup, model, language_code=None):
+    """Prefetch of the ``translations`` at ``lookup``; only ``language_code`` and the fallback rows when given.
+
+    ``model`` is the translatable model the lookup ends on.
+    """
+    if language_code is None:
+        return lookup
+    return Prefetch(lookup, queryset=model._parler_meta.root_model.objects.filter(
+        language_code__in={language_code, FALLBACK_LANGUAGE},
+    ))
+
+
+class LanguageProjectionMixin:
+    """Replace ``translations`` by the requested language's fields with ``?translations=current``.
+
+    Values come from the prefetched translation rows, falling back to uz and
+    then to any language; without the parameter the all-languages form stays.
+    A top-level serializer with ``?fields=`` only gets the translated fields listed there.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if projection_language(self.context.get('request')) is not None:
+            fields.pop('translations', None)
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.context.get('request')
+        language_code = projection_language(request)
+        if language_code is not None:
+            top_level = getattr(self, 'is_top_level', lambda: False)()
+            translations = {translation.language_code: translation for translation in instance.translations.all()}
+            translation = (
+                translations.get(language_code) or translations.get(FALLBACK_LANGUAGE)
+                or next(iter(translations.values()), None)
+            )
+            for name in type(instance)._parler_meta.get_translated_fields():
+                if not top_level or is_field_requested(request, name):
+                    data[name] = getattr(translation, name, None)
+        return data
@@ -0,0 +1,267 @@
+import functools
+import hashlib
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
+from parler.models import TranslatedFieldsModel
+from rest_framework.response import Response
+
+from apps.shared.cache import STALE_GRACE, bump_cache_version, get_cache_version, get_cache_versions, single_flight
+from apps.shared.signals import translations_bulk_created
+
+RESPONSE_CACHE_TIMEOUT = 60 * 10
+RESPONSE_CACHE_APPS = ('categories', 'products', 'company', 'services')
+# Bumped before the tags of every purge, so a response built while a purge was running is not stored.
+PURGE_NAMESPACE = 'response_purge'
+FALLBACK_LANGUAGE = 'uz'
+
+# Read models rebuilt from a product without signals; their rows stand for the product.
+PROJECTION_FIELDS = {
+    'products.productlisting': 'product',
+    'products.productdocument': 'product',
+    'products.productsearchdocument': 'product',
+}
+
+_collecting = threading.local()
+
+
+def _label(model):
+    return model._meta.concrete_model._meta.label_lower
+
+
+def type_tag(model):
+    return _label(model)
+
+
+def object_tag(model, pk):
+    return f'{_label(model)}:{pk}'
+
+
+def _tag_namespace(tag):
+    return f'response_tag:{tag}'
+
+
+def _source_field(model):
+    if issubclass(model, TranslatedFieldsModel):
+        return model._meta.get_field('master')
+    name = PROJECTION_FIELDS.get(_label(model))
+    return model._meta.get_field(name) if name else None
+
+
+def _instance_tag(instance):
+    field = _source_field(type(instance))
+    if field is not None:
+        return object_tag(field.related_model, getattr(instance, field.attname))
+    return object_tag(type(instance), instance.pk)
+
+
+def purge_tags(tags):
+    """Invalidate every cached response tagged with one of ``tags``."""
+    bump_cache_version(PURGE_NAMESPACE)
+    for tag in tags:
+        bump_cache_version(_tag_namespace(tag))
+
+
+def _response_key(request):
+    lang = request.query_params.get('lang', FALLBACK_LANGUAGE)
+    if lang not in dict(settings.LANGUAGES):
+        lang = FALLBACK_LANGUAGE
+    params = sorted(
+        (name, value) for name, values in request.query_params.lists() if name != 'lang' for value in values
+    )
+    raw = '|'.join([request.build_absolute_uri(request.path), get_language() or '', lang, urlencode(params)])
+    return 'response:' + hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def _load_entry(key):
+    """The stored entry of ``key`` (or None) and whether it is still fresh."""
+    entry = cache.get(key)
+    if entry is None:
+        return None, False
+    if entry['fresh_until'] <= time.time():
+        return entry, False
+    versions = get_cache_versions([_tag_namespace(tag) for tag in entry['tags']], create=False)
+    return entry, versions == {_tag_namespace(tag): version for tag, version in entry['tags'].items()}
+
+
+def _restore_response(entry):
+    if 'content' in entry:
+        return HttpResponse(entry['content'], content_type=entry['content_type'], status=entry['status'])
+    return Response(entry['data'], status=entry['status'], headers=entry['headers'])
+
+
+def _etag(key, tag_versions):
+    raw = '|'.join([key, *(f'{tag}:{version}' for tag, version in sorted(tag_versions.items()))])
+    return quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+
+def _store_response(key, response, tags, purge_version, timeout, previous=None):
+    namespaces = {_tag_namespace(tag): tag for tag in tags}
+    versions = get_cache_versions(namespaces)
+    if get_cache_version(PURGE_NAMESPACE) != purge_version:
+        return None
+    tag_versions = {tag: versions[namespace] for namespace, tag in namespaces.items()}
+    etag = _etag(key, tag_versions)
+    entry = {
+        'tags': tag_versions,
+        'status': response.status_code,
+        'fresh_until': time.time() + timeout,
+        'etag': etag,
+        # Unchanged tag versions mean unchanged data: keep the time it last changed.
+        'last_modified': (
+            previous['last_modified'] if previous is not None and previous.get('etag') == etag else int(time.time())
+        ),
+    }
+    if isinstance(response, Response):
+        entry['data'] = response.data
+        entry['headers'] = {name: value for name, value in response.items() if name.lower() != 'content-type'}
+    else:
+        entry['content'] = response.content
+        entry['content_type'] = response['Content-Type']
+    cache.set(key, entry, timeout + STALE_GRACE)
+    return entry
+
+
+def _conditional_response(request, response, entry):
+    """Add the entry's ETag / Last-Modified to ``response``; a 304 instead when the client has it."""
+    if entry is None or 'etag' not in entry:
+        return response
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['last_modified'])
+    return get_conditional_response(
+        request, etag=entry['etag'], last_modified=entry['last_modified'], response=response,
+    )
+
+
+def conditional_response(request, response, entries):
+    """Add validators to a JSON ``response`` assembled from ``{name: entry}`` cache entries.
+
+    The entries come from :func:`apps.shared.cache.get_or_compute_entry`; the
+    ETag is derived from the URL and the version of each entry actually
+    served, Last-Modified is when the newest one was built. A 304 instead
+    when the client already has them.
+    """
+    if request.accepted_renderer.format != 'json' or any('built_at' not in entry for entry in entries.values()):
+        return response
+    return _conditional_response(request, response, {
+        'etag': _etag(request.build_absolute_uri(), {name: entry['version'] for name, entry in entries.items()}),
+        'last_modified': int(max(entry['built_at'] for entry in entries.values())),
+    })
+
+
+def cache_response(*models, timeout=RESPONSE_CACHE_TIMEOUT):
+    """Cache the JSON responses of a DRF view's ``get``, tagged by what they were built from.
+
+    Applied to a view class it wraps the class's ``get``. Entries are keyed by
+    URL, active language, normalized ``lang`` and the other query params, and
+    tagged with the type of every model in ``models`` (list membership) plus
+    every instance loaded while building the response. Saving or deleting an
+    instance purges its own tag, its type tag and the tags of the rows it
+    points to, so only responses built from them are rebuilt. A hit returns
+    the stored payload without touching the ORM or the serializers.
+
+    A stale entry is rebuilt by a single worker while concurrent requests
+    keep getting the stale payload; identical requests in one process share
+    one rebuild (see :func:`apps.shared.cache.single_flight`).
+
+    Cached responses carry an ETag derived from the versions of their tags
+    and a Last-Modified of when those last changed; ``If-None-Match`` /
+    ``If-Modified-Since`` requests matching a fresh entry get a 304 straight
+    from the entry.
+    """
+    def decorator(view):
+        if isinstance(view, type):
+            view.get = decorator(view.get)
+            return view
+
+        @functools.wraps(view)
+        def wrapper(self, request, *args, **kwargs):
+            if request.accepted_renderer.format != 'json':
+                return view(self, request, *args, **kwargs)
+
+            key = _response_key(request)
+            stale, fresh = _load_entry(key)
+            if fresh:
+                return _conditional_response(request, _restore_response(stale), stale)
+
+            live = {}
+
+            def rebuild():
+                purge_version = get_cache_version(PURGE_NAMESPACE)
+                previous = getattr(_collecting, 'tags', None)
+                _collecting.tags = tags = {type_tag(model) for model in models}
+                try:
+                    response = live['response'] = view(self, request, *args, **kwargs)
+                finally:
+                    _collecting.tags = previous
+                    if previous is not None:
+                        previous |= tags
+                if response.status_code != 200:
+                    return None
+                return _store_response(key, response, tags, purge_version, timeout, previous=stale)
+
+            def reload():
+                current, current_fresh = _load_entry(key)
+                return current if current_fresh else None
+
+            entry = single_flight(key, rebuild, reload, stale=stale)
+            # This thread built the response itself, or got the entry another worker built.
+            response = live['response'] if 'response' in live else _restore_response(entry)
+            return _conditional_response(request, response, entry)
+        return wrapper
+    return decorator
+
+
+def collect_tags(*tags):
+    """Tag the response being built with ``tags``, for data read without loading model instances."""
+    collected = getattr(_collecting, 'tags', None)
+    if collected is not None:
+        collected.update(tags)
+
+
+def _collect_instance(sender, instance, **kwargs):
+    tags = getattr(_collecting, 'tags', None)
+    if tags is not None and instance.pk is not None:
+        tags.add(_instance_tag(instance))
+
+
+def _purge_instance(sender, instance, **kwargs):
+    tags = {type_tag(sender)}
+    if instance.pk is not None:
+        tags.add(object_tag(sender, instance.pk))
+    for field in sender._meta.concrete_fields:
+        if field.many_to_one or field.one_to_one:
+            value = getattr(instance, field.attname)
+            if value is not None:
+                tags.add(object_tag(field.related_model, value))
+    transaction.on_commit(lambda: purge_tags(tags))
+
+
+def _purge_bulk_translations(sender, master_ids, **kwargs):
+    tags = {object_tag(sender, master_id) for master_id in master_ids}
+    transaction.on_commit(lambda: purge_tags(tags))
+
+
+for _app_label in RESPONSE_CACHE_APPS:
+    for _model in apps.get_app_config(_app_label).get_models():
+        _uid = _label(_model)
+        post_init.connect(_collect_instance, sender=_model, dispatch_uid=f'response_cache_{_uid}_init')
+        if _uid in PROJECTION_FIELDS:
+            # Changed only through their product's signals; a delete receiver would also stop fast deletes.
+            continue
+        post_save.connect(_purge_instance, sender=_model, dispatch_uid=f'response_cache_{_uid}_save')
+        post_delete.connect(_purge_instance, sender=_model, dispatch_uid=f'response_cache_{_uid}_delete')
+        if hasattr(_model, '_parler_meta'):
+            translations_bulk_created.connect(
+                _purge_bulk_translations, sender=_model, dispatch_uid=f'response_cache_{_uid}_bulk',
+            )
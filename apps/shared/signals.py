@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent with ``sender=<translatable model>`` and ``master_ids`` after translation
+# rows were inserted with bulk_create, which does not send post_save.
+translations_bulk_created = Signal()
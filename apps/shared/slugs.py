@@ -0,0 +1,80 @@
+import threading
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+from apps.shared.cache import bump_cache_version, get_cache_version
+
+# Models looked up by their (master table, unique) ``slug`` in detail URLs.
+SLUG_MODELS = ('products.Product', 'categories.SubCategory', 'categories.Category', 'company.New')
+
+_maps = {}
+_maps_lock = threading.Lock()
+
+
+def _namespace(model):
+    return f'slugs:{model._meta.label_lower}'
+
+
+def _slug_map(model):
+    """The process-local ``{slug: pk}`` map of ``model``, reloaded once its version moves."""
+    namespace = _namespace(model)
+    version = get_cache_version(namespace)
+    current = _maps.get(namespace)
+    if current is not None and current[0] == version:
+        return current[1]
+    with _maps_lock:
+        current = _maps.get(namespace)
+        if current is None or current[0] != version:
+            # The version is read before the rows, so a change committed meanwhile moves it again.
+            slugs = dict(model._base_manager.exclude(slug__isnull=True).exclude(slug='').values_list('slug', 'pk'))
+            current = _maps[namespace] = (version, slugs)
+    return current[1]
+
+
+def resolve_slug(model, slug):
+    """Primary key of the ``model`` row with ``slug``, or None when there is none.
+
+    The map lives in process memory and is versioned in the shared cache;
+    saving or deleting a row bumps the version on commit, so every process
+    reloads it (one two-column query) on its next lookup. Unknown slugs are
+    answered from the map without touching the database.
+    """
+    if not slug:
+        return None
+    return _slug_map(model).get(slug)
+
+
+def invalidate_slugs(model):
+    bump_cache_version(_namespace(model))
+
+
+def _invalidate_on_commit(sender, **kwargs):
+    transaction.on_commit(lambda: invalidate_slugs(sender))
+
+
+class SlugLookupMixin:
+    """``get_object`` for generic detail views looked up by slug: the slug is resolved
+    with :func:`resolve_slug`, then the row is fetched from ``get_queryset()`` by pk."""
+
+    def get_object_pk(self):
+        if not hasattr(self, '_object_pk'):
+            slug = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+            self._object_pk = resolve_slug(self.get_queryset().model, slug)
+        if self._object_pk is None:
+            raise Http404
+        return self._object_pk
+
+    def get_object(self):
+        obj = get_object_or_404(self.get_queryset(), pk=self.get_object_pk())
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+for _label in SLUG_MODELS:
+    _model = apps.get_model(_label)
+    post_save.connect(_invalidate_on_commit, sender=_model, dispatch_uid=f'slugs_{_label}_save')
+    post_delete.connect(_invalidate_on_commit, sender=_model, dispatch_uid=f'slugs_{_label}_delete')
@@ -1,3 +1,171 @@
-from django.test import TestCase
+import threading
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.products.models import Product, TopProduct
+
+from .cache import _flights, bump_cache_version, get_cache_version, get_or_compute, single_flight
+from .home import invalidate_home_section
+from .translation import auto_translate, remember_translation
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+# Nothing listens on port 1: every Redis call of this backend fails.
+UNREACHABLE_REDIS_CACHES = {'default': {
+    'BACKEND': 'apps.shared.cache_backends.TwoTierCache',
+    'LOCATION': 'redis://127.0.0.1:1/0',
+    'KEY_PREFIX': 'unreachable',
+    'OPTIONS': {'socket_connect_timeout': 0.1, 'socket_timeout': 0.1, 'FAILURE_THRESHOLD': 1, 'COOLDOWN': 60},
+}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class HomePageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        product = Product(sku='SKU-1')
+        product.set_current_language('uz')
+        product.name = 'Nasos'
+        product.save()
+        TopProduct.objects.create(product=product)
+
+    def setUp(self):
+        cache.clear()
+
+    def _top_product(self, **params):
+        response = self.client.get(reverse('home'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['top_products'][0]['product']
+
+    def test_projected_sections_are_cached_apart(self):
+        projected = self._top_product(translations='current')
+        self.assertEqual(projected['name'], 'Nasos')
+        self.assertNotIn('translations', projected)
+
+        full = self._top_product()
+        self.assertIn('translations', full)
+        self.assertNotIn('name', full)
+
+    def test_unchanged_page_is_not_modified(self):
+        response = self.client.get(reverse('home'))
+        self.assertIn('Last-Modified', response)
+        etag = response['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        invalidate_home_section('top_products')
+        response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AutoTranslateTests(TestCase):
+    def test_existing_target_row_is_kept(self):
+        product = Product(sku='SKU-1')
+        product.set_current_language('uz')
+        product.name = 'Nasos'
+        product.save()
+        translation_model = Product._parler_meta.root_model
+        # Inserted by the translation worker after the admin save read the translations.
+        translation_model.objects.filter(master=product, language_code='ru').delete()
+        translation_model.objects.create(master=product, language_code='ru', name='Насос (worker)')
+        remember_translation('Nasos', 'uz', 'ru', 'Насос')
+
+        source = translation_model.objects.get(master=product, language_code='uz')
+        auto_translate(product, source, ['name', 'description'], ['ru'])
+
+        self.assertEqual(
+            list(translation_model.objects.filter(master=product, language_code='ru').values_list('name', flat=True)),
+            ['Насос (worker)'],
+        )
+
+
+@override_settings(CACHES=UNREACHABLE_REDIS_CACHES)
+class TwoTierCacheOutageTests(SimpleTestCase):
+    def test_add_and_incr_fall_back_to_the_local_cache(self):
+        self.assertTrue(cache.add('outage:add', 1))
+        self.assertFalse(cache.add('outage:add', 2))
+        self.assertEqual(cache.get('outage:add'), 1)
+        self.assertEqual(cache.incr('outage:add'), 2)
+        self.assertEqual(cache.get('outage:add'), 2)
+        with self.assertRaises(ValueError):
+            cache.incr('outage:missing')
+
+    def test_cache_versions_stay_stable(self):
+        version = get_cache_version('outage')
+        self.assertEqual(get_cache_version('outage'), version)
+        bump_cache_version('outage')
+        self.assertEqual(get_cache_version('outage'), version + 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _run_threads(self, count, target):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        results = []
+        barrier = threading.Barrier(8)
+
+        def compute():
+            calls.append(1)
+            threading.Event().wait(0.2)
+            return 'value'
+
+        def request():
+            barrier.wait()
+            results.append(get_or_compute('flight:once', 'flight', compute, 60))
+
+        self._run_threads(8, request)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 8)
+
+    def test_stale_value_is_served_while_rebuilding(self):
+        get_or_compute('flight:stale', 'flight_stale', lambda: 'old', 60)
+        bump_cache_version('flight_stale')
+        started, release = threading.Event(), threading.Event()
+        rebuilt = []
+
+        def slow_compute():
+            started.set()
+            release.wait(5)
+            return 'new'
+
+        rebuilder = threading.Thread(
+            target=lambda: rebuilt.append(get_or_compute('flight:stale', 'flight_stale', slow_compute, 60)),
+        )
+        rebuilder.start()
+        self.assertTrue(started.wait(5))
+        try:
+            self.assertEqual(get_or_compute('flight:stale', 'flight_stale', self.fail, 60), 'old')
+        finally:
+            release.set()
+            rebuilder.join(5)
+        self.assertEqual(rebuilt, ['new'])
+        self.assertEqual(get_or_compute('flight:stale', 'flight_stale', self.fail, 60), 'new')
+
+    def test_stale_value_is_served_while_another_process_holds_the_lock(self):
+        cache.add('lock:flight:locked', 1, 30)
+        self.assertEqual(single_flight('flight:locked', self.fail, stale='old'), 'old')
+
+    def test_lock_is_released_when_compute_raises(self):
+        def broken():
+            raise RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            single_flight('flight:broken', broken)
+        self.assertFalse(cache.has_key('lock:flight:broken'))
+        self.assertNotIn('flight:broken', _flights)
+        self.assertEqual(single_flight('flight:broken', lambda: 'value'), 'value')
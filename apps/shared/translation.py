@@ -0,0 +1,258 @@
+import asyncio
+import hashlib
+
+from django.core.cache import cache
+from django.utils import timezone
+from parler.cache import get_translation_cache_key
+
+from apps.company.middleware import get_logger
+
+from .models import TranslationJob, TranslationMemory
+from .signals import translations_bulk_created
+from .translation_providers import provider_translate
+
+logger = get_logger()
+
+MEMORY_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
+MEMORY_HITS_KEY = 'translation_memory:hits'
+MEMORY_MISSES_KEY = 'translation_memory:misses'
+# Upper bound on simultaneous translator requests made by translate_many().
+TRANSLATION_CONCURRENCY = 8
+
+
+def _text_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _memory_cache_key(text_hash, src_lang, dest_lang):
+    return f'translation_memory:{text_hash}:{src_lang}:{dest_lang}'
+
+
+def _count(key, amount):
+    if not amount:
+        return
+    try:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, amount)
+    except Exception as e:
+        logger.warning(f"⚠️ Translation memory counter update failed: {e}")
+
+
+def lookup_translations(texts, src_lang, dest_lang):
+    """Return ``{text: translation}`` for every text already in translation memory.
+
+    Redis is consulted first; database hits are copied back into Redis.
+    """
+    hashes = {_text_hash(text): text for text in {(t or '').strip() for t in texts} if text}
+    if not hashes:
+        return {}
+
+    found = {}
+    keys = {_memory_cache_key(h, src_lang, dest_lang): h for h in hashes}
+    try:
+        cached = cache.get_many(list(keys))
+    except Exception as e:
+        logger.warning(f"⚠️ Translation memory cache read failed: {e}")
+        cached = {}
+    for key, translated in cached.items():
+        found[hashes[keys[key]]] = translated
+
+    missing = [h for h in hashes if hashes[h] not in found]
+    if missing:
+        rows = TranslationMemory.objects.filter(
+            source_hash__in=missing,
+            source_lang=src_lang,
+            target_lang=dest_lang,
+        ).values_list('source_hash', 'translated_text')
+        backfill = {}
+        for text_hash, translated in rows:
+            found[hashes[text_hash]] = translated
+            backfill[_memory_cache_key(text_hash, src_lang, dest_lang)] = translated
+        if backfill:
+            try:
+                cache.set_many(backfill, timeout=MEMORY_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"⚠️ Translation memory cache write failed: {e}")
+
+    _count(MEMORY_HITS_KEY, len(found))
+    _count(MEMORY_MISSES_KEY, len(hashes) - len(found))
+    return found
+
+
+def remember_translation(text, src_lang, dest_lang, translated):
+    """Store a fresh translation in both the database and Redis."""
+    text = (text or '').strip()
+    if not text or not translated:
+        return
+
+    text_hash = _text_hash(text)
+    TranslationMemory.objects.get_or_create(
+        source_hash=text_hash,
+        source_lang=src_lang,
+        target_lang=dest_lang,
+        defaults={'source_text': text, 'translated_text': translated},
+    )
+    try:
+        cache.set(_memory_cache_key(text_hash, src_lang, dest_lang), translated, timeout=MEMORY_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"⚠️ Translation memory cache write failed: {e}")
+
+
+def get_memory_stats():
+    """Return translation memory hit/miss counters and the resulting hit rate."""
+    try:
+        counters = cache.get_many([MEMORY_HITS_KEY, MEMORY_MISSES_KEY])
+    except Exception:
+        counters = {}
+    hits = counters.get(MEMORY_HITS_KEY, 0)
+    misses = counters.get(MEMORY_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / total if total else 0.0,
+    }
+
+
+def translate_text(text, src_lang, dest_lang):
+    """Translate ``text`` and return the translated string.
+
+    Translation memory is checked before calling the translator. Blank input
+    is returned as an empty string. Raises ``TranslationUnavailable`` when the
+    provider fails, times out or its circuit breaker is open.
+    """
+    text = (text or '').strip()
+    if not text:
+        return ''
+
+    remembered = lookup_translations([text], src_lang, dest_lang).get(text)
+    if remembered is not None:
+        return remembered
+
+    translated = provider_translate(text, src_lang, dest_lang)
+    remember_translation(text, src_lang, dest_lang, translated)
+    return translated
+
+
+async def _translate_concurrently(pending, src_lang, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(text, dest_lang):
+        async with semaphore:
+            return await asyncio.to_thread(provider_translate, text, src_lang, dest_lang)
+
+    return await asyncio.gather(
+        *(run(text, dest_lang) for text, dest_lang in pending),
+        return_exceptions=True,
+    )
+
+
+def translate_many(texts, src_lang, dest_langs, concurrency=TRANSLATION_CONCURRENCY):
+    """Translate many strings into several languages at once.
+
+    Identical strings are translated once, translation memory is consulted
+    first, and the remaining calls run concurrently (at most ``concurrency``
+    in flight). Returns ``{dest_lang: {text: translation}}``; strings whose
+    translation failed are left out so callers can pick their own fallback.
+    """
+    unique_texts = {(text or '').strip() for text in texts} - {''}
+    results = {lang: lookup_translations(unique_texts, src_lang, lang) for lang in dest_langs}
+
+    pending = [
+        (text, lang)
+        for lang in dest_langs
+        for text in unique_texts
+        if text not in results[lang]
+    ]
+    if not pending:
+        return results
+
+    translated = asyncio.run(_translate_concurrently(pending, src_lang, concurrency))
+    for (text, lang), value in zip(pending, translated):
+        if isinstance(value, Exception):
+            logger.error(f"❌ Translation failed for {lang} (src: {src_lang}): {value}")
+            continue
+        results[lang][text] = value
+        remember_translation(text, src_lang, lang, value)
+
+    return results
+
+
+def enqueue_translation_jobs(instance, fields, source_lang, target_langs):
+    """Queue background translation of ``fields`` of ``instance`` into ``target_langs``.
+
+    Re-queuing an already known (object, field, language) resets it to pending.
+    """
+    now = timezone.now()
+    jobs = [
+        TranslationJob(
+            model_label=instance._meta.label_lower,
+            object_id=instance.pk,
+            field=field,
+            source_lang=source_lang,
+            target_lang=lang,
+            available_at=now,
+        )
+        for lang in target_langs
+        for field in fields
+    ]
+    if not jobs:
+        return
+
+    TranslationJob.objects.bulk_create(
+        jobs,
+        update_conflicts=True,
+        unique_fields=['model_label', 'object_id', 'field', 'target_lang'],
+        update_fields=['source_lang', 'status', 'attempts', 'last_error', 'available_at', 'updated_at'],
+    )
+
+
+def forget_cached_translations(translation_model, pairs):
+    """Drop parler's cached entries (including "missing" markers) for ``(master_id, language_code)`` pairs."""
+    keys = [get_translation_cache_key(translation_model, master_id, lang) for master_id, lang in pairs]
+    try:
+        cache.delete_many(keys)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to clear cached translations: {e}")
+
+
+def auto_translate(instance, source, fields, target_langs):
+    """Fill missing translations of ``instance`` from translation memory where possible.
+
+    ``source`` is the translation row to translate from. Languages whose every
+    field is already in translation memory are inserted with a single
+    bulk_create; the rest are queued for ``run_translation_worker``. Returns
+    the queued languages.
+    """
+    source_lang = source.language_code
+    values = {field: (getattr(source, field) or '').strip() for field in fields}
+    copied = {field: getattr(source, field) for field in getattr(type(instance), 'auto_translate_copy_fields', ())}
+    translation_model = instance._parler_meta.root_model
+
+    rows = []
+    queued = []
+    for lang in target_langs:
+        remembered = lookup_translations(values.values(), source_lang, lang)
+        if not all(remembered.get(text) for text in values.values() if text):
+            queued.append(lang)
+            continue
+
+        rows.append(translation_model(
+            master=instance,
+            language_code=lang,
+            **copied,
+            **{field: remembered.get(text, '') for field, text in values.items()},
+        ))
+
+    if rows:
+        # run_translation_worker may have inserted some of these rows meanwhile; keep those.
+        translation_model.objects.bulk_create(rows, ignore_conflicts=True)
+        # bulk_create bypasses parler's bookkeeping; drop cached "missing" markers.
+        local_cache = instance._translations_cache[translation_model]
+        for row in rows:
+            local_cache.pop(row.language_code, None)
+        forget_cached_translations(translation_model, [(instance.pk, row.language_code) for row in rows])
+        translations_bulk_created.send(sender=type(instance), master_ids=[instance.pk])
+
+    enqueue_translation_jobs(instance, fields, source_lang, queued)
+    return queued
@@ -0,0 +1,118 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .circuit_breaker import CircuitBreaker
+
+
+class TranslationUnavailable(Exception):
+    """Raised when a translation could not be produced (failure, timeout or open circuit)."""
+
+
+class BaseTranslationProvider:
+    """Interface every translation backend implements."""
+
+    def translate(self, text, src_lang, dest_lang, timeout):
+        """Return ``text`` translated from ``src_lang`` to ``dest_lang`` within ``timeout`` seconds."""
+        raise NotImplementedError
+
+
+class GoogleTranslationProvider(BaseTranslationProvider):
+    """googletrans backend with a hard per-call deadline."""
+
+    def __init__(self, max_workers=16):
+        self._local = threading.local()
+        # Calls run in this pool so a hung request only ties up a pool thread, never the caller.
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='googletrans')
+
+    def _translator(self, timeout):
+        # googletrans clients are not shared between threads.
+        translator = getattr(self._local, 'translator', None)
+        if translator is None:
+            from googletrans import Translator
+
+            translator = self._local.translator = Translator(timeout=timeout)
+        return translator
+
+    def _call(self, text, src_lang, dest_lang, timeout):
+        result = self._translator(timeout).translate(text, src=src_lang, dest=dest_lang)
+        if inspect.isawaitable(result):
+            result = asyncio.run(asyncio.wait_for(result, timeout))
+        return result.text
+
+    def translate(self, text, src_lang, dest_lang, timeout):
+        future = self._executor.submit(self._call, text, src_lang, dest_lang, timeout)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TranslationUnavailable(f"Translation timed out after {timeout}s")
+
+
+class StubTranslationProvider(BaseTranslationProvider):
+    """Deterministic offline backend for tests and benchmarks."""
+
+    def translate(self, text, src_lang, dest_lang, timeout):
+        return f"[{dest_lang}] {text}"
+
+
+PROVIDERS = {
+    'google': GoogleTranslationProvider,
+    'stub': StubTranslationProvider,
+}
+
+_provider = None
+_breaker = None
+_setup_lock = threading.Lock()
+
+
+def get_provider():
+    """Return the configured provider (``settings.TRANSLATION_PROVIDER``), built once per process."""
+    global _provider
+    if _provider is None:
+        with _setup_lock:
+            if _provider is None:
+                name = getattr(settings, 'TRANSLATION_PROVIDER', 'google')
+                provider_class = PROVIDERS.get(name) or import_string(name)
+                _provider = provider_class()
+    return _provider
+
+
+def get_breaker():
+    global _breaker
+    if _breaker is None:
+        with _setup_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker(
+                    failure_threshold=getattr(settings, 'TRANSLATION_BREAKER_THRESHOLD', 5),
+                    cooldown=getattr(settings, 'TRANSLATION_BREAKER_COOLDOWN', 60),
+                )
+    return _breaker
+
+
+def provider_translate(text, src_lang, dest_lang):
+    """Translate through the configured provider, honouring the deadline and circuit breaker.
+
+    Raises :class:`TranslationUnavailable` if the circuit is open or the call fails.
+    """
+    breaker = get_breaker()
+    if not breaker.allow():
+        raise TranslationUnavailable("Translation provider circuit is open")
+
+    try:
+        translated = get_provider().translate(
+            text, src_lang, dest_lang,
+            timeout=getattr(settings, 'TRANSLATION_TIMEOUT', 5),
+        )
+    except Exception as e:
+        breaker.record_failure()
+        if isinstance(e, TranslationUnavailable):
+            raise
+        raise TranslationUnavailable(str(e)) from e
+
+    breaker.record_success()
+    return translated
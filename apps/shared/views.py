@@ -1,3 +1,14 @@
-from django.shortcuts import render
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from .home import get_home_page_entries
+from .response_cache import conditional_response
+
+
+class HomeView(APIView):
+    """Banners, top products, new arrivals, categories, partners and company info in one response"""
+    def get(self, request):
+        lang = request.GET.get('lang', 'uz')
+        entries = get_home_page_entries(request, lang)
+        page = {section: entry['value'] for section, entry in entries.items()}
+        return conditional_response(request, Response(page), entries)
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'drf_yasg',
     # 'drf_spectacular',
 
@@ -206,6 +207,8 @@ CORS_ALLOW_HEADERS = [
     'x-csrftoken',
     'x-requested-with',
 ]
+# Cursor pagination returns the next/previous page URLs in the Link header.
+CORS_EXPOSE_HEADERS = ['Link']
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024
@@ -248,10 +251,19 @@ REDIS_URL = "redis://localhost:6379/7"
 
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        # Redis behind an in-process LRU; degrades to the local cache / database while Redis is down.
+        'BACKEND': 'apps.shared.cache_backends.TwoTierCache',
         'LOCATION': 'redis://127.0.0.1:6379/1',
         'KEY_PREFIX': 'nonbor',
         'TIMEOUT': 300,
+        'OPTIONS': {
+            'L1_MAX_ENTRIES': 2000,
+            'L1_TIMEOUT': 60,
+            'FAILURE_THRESHOLD': 3,
+            'COOLDOWN': 30,
+            'socket_connect_timeout': 0.25,
+            'socket_timeout': 0.25,
+        },
     }
 }
 
@@ -264,5 +276,13 @@ SESSION_COOKIE_SECURE = not DEBUG  # Production'da HTTPS orqali
 SESSION_COOKIE_HTTPONLY = True  # XSS himoyasi
 CSRF_COOKIE_SECURE = not DEBUG
 
+# Auto-translation provider: 'google', 'stub' (deterministic, offline - for tests/benchmarks)
+# or a dotted path to a BaseTranslationProvider subclass.
+TRANSLATION_PROVIDER = os.getenv('TRANSLATION_PROVIDER', 'google')
+TRANSLATION_TIMEOUT = float(os.getenv('TRANSLATION_TIMEOUT', '5'))  # seconds per call
+# Skip translation for TRANSLATION_BREAKER_COOLDOWN seconds after this many consecutive failures.
+TRANSLATION_BREAKER_THRESHOLD = 5
+TRANSLATION_BREAKER_COOLDOWN = 60
+
 # Frontend domain used in externally shared links (e.g. Telegram inquiry messages).
 BASE_URL = os.getenv('BASE_URL', 'https://gidrox.uz')
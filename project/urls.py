@@ -22,6 +22,8 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from apps.shared.views import HomeView
+
 schema = get_schema_view(
     openapi.Info(
         title="Gidrox",
@@ -40,6 +42,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     
     # API endpoints - organized by app
+    path('api/home/', HomeView.as_view(), name='home'),
     path('api/categories/', include('apps.categories.urls')),
     path('api/products/', include('apps.products.urls')),
     path('api/company/', include('apps.company.urls')),